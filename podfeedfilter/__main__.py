@@ -4,13 +4,19 @@ Serves as the main entry point when running `python -m podfeedfilter`.
 Provides the main() function that parses command-line arguments,
 loads YAML configuration files, and processes each configured feed.
 """
+from __future__ import annotations
+
 import argparse
+import dataclasses
+import functools
+from typing import Sequence
 from .config import load_config
 from .filterer import process_feed
 
 
-def main() -> None:
-    """Main entry point for command-line execution."""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once; parsing does not modify it."""
     parser = argparse.ArgumentParser(description="Filter podcast feeds")
     parser.add_argument(
         "-c", "--config", default="feeds.yaml", help="Path to feed "
@@ -24,7 +30,16 @@ def main() -> None:
         "-p", "--private", choices=["true", "false"],
         help="Override private setting for all feeds (true/false)"
     )
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Main entry point for command-line execution.
+
+    Args:
+        argv: Arguments to parse instead of sys.argv[1:]
+    """
+    args = _build_parser().parse_args(argv)
     feeds = load_config(args.config)
 
     # Apply CLI private override if specified
@@ -34,7 +49,7 @@ def main() -> None:
 
     for feed in feeds:
         if private_override is not None:
-            feed.private = private_override
+            feed = dataclasses.replace(feed, private=private_override)
         process_feed(feed, no_check_modified=args.no_check_modified)
 
 
@@ -7,14 +7,27 @@ output files with different include/exclude criteria.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+import functools
+import json
+from os import PathLike
+from pathlib import Path
 from typing import List
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class FeedConfig:
-    """Configuration for a single podcast feed filtering task."""
+    """Configuration for a single podcast feed filtering task.
+
+    Instances are immutable; use dataclasses.replace() to derive a
+    modified copy.
+    """
     url: str
     output: str
     include: List[str] = field(default_factory=list)
@@ -23,12 +36,35 @@ class FeedConfig:
     description: str | None = None
     check_modified: bool = True
     private: bool = True
+    adaptive_poll: bool = False
+    min_poll_interval: float = 0.0
+    fast_parse: bool = False
+
+
+def load_config(path: str | PathLike[str]) -> List[FeedConfig]:
+    """Parse the YAML config into a list of FeedConfig objects.
+
+    A path ending in ``.json`` is read with the json module instead of
+    PyYAML. Parsed configs are cached by file content and the cached
+    result is shared: each call returns new FeedConfig objects with their
+    own include/exclude lists, but the instances are frozen, so apply
+    overrides with dataclasses.replace().
+    """
+    config_path = Path(path)
+    is_json = config_path.suffix.lower() == ".json"
+    return [
+        replace(feed, include=list(feed.include), exclude=list(feed.exclude))
+        for feed in _parse_config(config_path.read_bytes(), is_json)
+    ]
 
 
-def load_config(path: str) -> List[FeedConfig]:
-    """Parse the YAML config into a list of FeedConfig objects."""
-    with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+@functools.lru_cache(maxsize=128)
+def _parse_config(raw: bytes, is_json: bool = False) -> tuple[FeedConfig, ...]:
+    """Parse config bytes; shared results must not be mutated."""
+    if is_json:
+        data = json.loads(raw) or {}
+    else:
+        data = yaml.load(raw, Loader=_SafeLoader) or {}
 
     feeds: List[FeedConfig] = []
     for item in data.get("feeds", []):
@@ -52,6 +88,9 @@ def load_config(path: str) -> List[FeedConfig]:
                     description=item.get("description"),
                     check_modified=item.get("check_modified", True),
                     private=bool(item.get("private", True)),
+                    adaptive_poll=bool(item.get("adaptive_poll", False)),
+                    min_poll_interval=float(item.get("min_poll_interval") or 0),
+                    fast_parse=bool(item.get("fast_parse", False)),
                 )
             )
 
@@ -68,7 +107,13 @@ def load_config(path: str) -> List[FeedConfig]:
                     description=split.get("description"),
                     check_modified=split.get("check_modified", item.get("check_modified", True)),
                     private=bool(split.get("private", True)),
+                    adaptive_poll=bool(split.get(
+                        "adaptive_poll", item.get("adaptive_poll", False))),
+                    min_poll_interval=float(split.get(
+                        "min_poll_interval", item.get("min_poll_interval")) or 0),
+                    fast_parse=bool(split.get(
+                        "fast_parse", item.get("fast_parse", False))),
                 )
             )
 
-    return feeds
+    return tuple(feeds)
@@ -3,42 +3,261 @@
 Provides process_feed() function to download RSS feeds, filter episodes
 based on include/exclude keywords, and generate filtered output feeds.
 Includes helper functions _text_matches(), _entry_passes(), and
-_copy_entry() for content matching and feed generation.
+_copy_entry() for content matching and feed generation, plus
+_fast_parse(), an opt-in libxml2-backed reader for plain RSS 2.0 feeds.
 """
 from __future__ import annotations
 from pathlib import Path
-from typing import cast
+from typing import Any, Iterable, Sequence, cast
 import email.utils
+import functools
+import hashlib
+import json
 import os
+import time
 import feedparser
 import requests
 from feedgen.feed import FeedGenerator
+from lxml import etree
 from .config import FeedConfig
 from .author_utils import extract_authors
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - no wheel for this platform
+    ahocorasick = None
+
+
+# Parser for _fast_parse(); feed XML is untrusted, so never expand entities
+# or reach out to the network while parsing it.
+_XML_PARSER = etree.XMLParser(resolve_entities=False, no_network=True)
+
+# RSS 2.0 item children copied by _fast_parse(), mapped to the keys
+# feedparser would use for them
+_FAST_ITEM_FIELDS = {
+    "title": "title",
+    "link": "link",
+    "guid": "id",
+    "description": "summary",
+    "pubDate": "published",
+}
+
+_ITUNES_NS = "{http://www.itunes.com/dtds/podcast-1.0.dtd}"
+_CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+
+# Item children feedparser reads as the entry author; the last one wins
+_FAST_AUTHOR_TAGS = frozenset({
+    "author",
+    "{http://purl.org/dc/elements/1.1/}creator",
+    _ITUNES_NS + "author",
+})
+
+# iTunes item children feedparser keeps under keys that filtering and
+# _copy_entry() never read, so _fast_parse() can skip them
+_FAST_SKIPPED_TAGS = frozenset(
+    _ITUNES_NS + name
+    for name in ("duration", "episode", "episodeType", "season", "title",
+                 "subtitle", "image", "explicit", "block", "keywords")
+)
+
+
+def _fast_parse(xml_bytes: bytes) -> feedparser.FeedParserDict:
+    """Parse a feed document, reading plain RSS 2.0 directly with lxml.
+
+    Plain RSS skips feedparser's sanitization and date handling; the result
+    has the same shape as feedparser.parse() (``feed`` plus ``entries``, with
+    only the keys present in the document) so process_feed can use either.
+    Of the namespaced item children, ``content:encoded``, ``dc:creator``,
+    ``itunes:author`` and the iTunes episode metadata that is never copied
+    are understood. Anything else (Atom, RDF, namespaced roots, items with
+    other namespaced children such as ``itunes:summary``, or XML that
+    libxml2 rejects) is handed to feedparser unchanged.
 
-def _text_matches(text: str, keywords: list[str]) -> bool:
-    lower = text.lower()
+    Args:
+        xml_bytes: Raw feed document
+
+    Returns:
+        Parsed feed with ``feed`` and ``entries``
+    """
+    try:
+        root = etree.fromstring(xml_bytes, parser=_XML_PARSER)
+    except etree.XMLSyntaxError:
+        root = None
+
+    channel = root.find("channel") if root is not None and root.tag == "rss" else None
+    if channel is None:
+        return feedparser.parse(xml_bytes)
+
+    entries = []
+    for item in channel.iter("item"):
+        entry = feedparser.FeedParserDict()
+        for tag, key in _FAST_ITEM_FIELDS.items():
+            text = item.findtext(tag)
+            if text is not None:
+                entry[key] = text.strip()
+        content = []
+        for child in item:
+            tag = child.tag
+            if tag in _FAST_AUTHOR_TAGS:
+                entry["author"] = (child.text or "").strip()
+            elif tag == _CONTENT_ENCODED:
+                content.append(feedparser.FeedParserDict(
+                    type="text/html", value=(child.text or "").strip()))
+            elif (isinstance(tag, str) and tag.startswith("{")
+                  and tag not in _FAST_SKIPPED_TAGS):
+                # Unmapped extension; let feedparser handle it rather than
+                # silently dropping what it carries
+                return feedparser.parse(xml_bytes)
+        if content:
+            entry["content"] = content
+            # feedparser falls back to the first content for the summary
+            entry.setdefault("summary", content[0]["value"])
+        # Like feedparser, a permalink guid stands in for a missing link
+        guid = item.find("guid")
+        if ("link" not in entry and "id" in entry
+                and guid.get("isPermaLink", "true") == "true"):
+            entry["link"] = entry["id"]
+        # FeedParserDict derives "enclosures" from rel="enclosure" links,
+        # and feedparser calls the enclosure's url attribute href
+        entry["links"] = [
+            feedparser.FeedParserDict(
+                {("href" if name == "url" else name): value
+                 for name, value in enc.attrib.items()},
+                rel="enclosure")
+            for enc in item.iter("enclosure")
+        ]
+        entries.append(entry)
+
+    feed = feedparser.FeedParserDict({
+        key: text.strip()
+        for key in ("title", "link")
+        if (text := channel.findtext(key)) is not None
+    })
+    # feedparser reads the channel description as the last of <description>
+    # and itunes:subtitle, unless an itunes:summary overrides both
+    description = None
+    for child in channel:
+        if child.tag in ("description", _ITUNES_NS + "subtitle"):
+            description = (child.text or "").strip()
+    summary = channel.findtext(_ITUNES_NS + "summary")
+    if summary is not None:
+        description = summary.strip()
+    if description is not None:
+        feed["description"] = description
+    return feedparser.FeedParserDict(feed=feed, entries=entries)
+
+
+# Key marking the end of a keyword in a _build_trie() node; no text
+# character is the empty string, so it cannot collide with a child.
+_TRIE_END = ""
+
+KeywordTrie = dict[str, Any]
+
+
+def _build_trie(keywords: Iterable[str]) -> KeywordTrie:
+    """Build a nested-dict prefix trie over already-casefolded keywords."""
+    trie: KeywordTrie = {}
     for kw in keywords:
-        if kw.lower() in lower:
-            return True
+        node = trie
+        for ch in kw:
+            node = node.setdefault(ch, {})
+        node[_TRIE_END] = True
+    return trie
+
+
+def _trie_search(trie: KeywordTrie, text: str) -> bool:
+    """Return True if any keyword in the trie occurs in text.
+
+    Walks the trie from every start position, so the cost is bounded by
+    len(text) times the longest keyword rather than the number of keywords.
+    """
+    n = len(text)
+    for start in range(n):
+        node = trie
+        for i in range(start, n):
+            node = node.get(text[i])
+            if node is None:
+                break
+            if _TRIE_END in node:
+                return True
     return False
 
 
-def _entry_passes(entry: feedparser.FeedParserDict, include: list[str],
-                  exclude: list[str]) -> bool:
-    content = (
-        f"{entry.get('title', '')} "
-        f"{entry.get('description', '')} "
-        f"{entry.get('summary', '')}"
-    )
-    if exclude and _text_matches(content, exclude):
+@functools.lru_cache(maxsize=128)
+def _keyword_automaton(keywords: tuple[str, ...]) -> Any:
+    """Build a multi-pattern matcher over the casefolded keywords.
+
+    The matcher is a pyahocorasick automaton, or a _build_trie() trie where
+    pyahocorasick is not installed. Cached so a keyword list shared by
+    several feeds or splits is only built once per run.
+
+    Args:
+        keywords: Non-empty tuple of keywords
+
+    Returns:
+        The matcher, or True when an empty keyword is present (an empty
+        string is a substring of any text)
+    """
+    if "" in keywords:
+        return True
+    if ahocorasick is None:
+        return _build_trie(kw.casefold() for kw in keywords)
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw.casefold(), kw)
+    automaton.make_automaton()
+    return automaton
+
+
+def _keyword_matcher(keywords: Sequence[str]) -> Any:
+    """Resolve a keyword list to the matcher _any_keyword() takes.
+
+    Resolve once per feed and reuse the result for every entry; None stands
+    for an empty list, which matches nothing.
+    """
+    return _keyword_automaton(tuple(keywords)) if keywords else None
+
+
+def _any_keyword(folded: str, matcher: Any) -> bool:
+    """Return True if a _keyword_matcher() matcher hits already-casefolded text."""
+    if matcher is None:
         return False
-    if include and not _text_matches(content, include):
+    if matcher is True:
+        return True
+    if isinstance(matcher, dict):
+        return _trie_search(matcher, folded)
+    return next(matcher.iter(folded), None) is not None
+
+
+def _text_matches(text: str, keywords: Sequence[str]) -> bool:
+    return _any_keyword(text.casefold(), _keyword_matcher(keywords))
+
+
+def _content_passes(content: str, include: Any, exclude: Any) -> bool:
+    """Apply include/exclude matchers to a casefolded entry haystack."""
+    if exclude is not None and _any_keyword(content, exclude):
+        return False
+    if include is not None and not _any_keyword(content, include):
         return False
     return True
 
 
+def _entry_haystack(entry: feedparser.FeedParserDict) -> str:
+    """Pull the searchable fields out of an entry as one casefolded string."""
+    # NUL never appears in feed text, so keywords cannot match across fields
+    return "\x00".join((
+        str(entry.get('title', '')),
+        str(entry.get('description', '')),
+        str(entry.get('summary', '')),
+    )).casefold()
+
+
+def _entry_passes(entry: feedparser.FeedParserDict, include: Sequence[str],
+                  exclude: Sequence[str]) -> bool:
+    return _content_passes(_entry_haystack(entry), _keyword_matcher(include),
+                           _keyword_matcher(exclude))
+
+
 def _conditional_fetch(url: str, since: float | None) -> tuple[bytes | None, float | None]:
     """Fetch URL with conditional request using If-Modified-Since header.
 
@@ -92,9 +311,9 @@ def _copy_entry(fe, entry: feedparser.FeedParserDict) -> None:
     if "content" in entry:
         for content in entry["content"]:
             fe.content(content.get("value", ""), type=content.get("type"))
-    if "enclosures" in entry:
-        for enc in entry["enclosures"]:
-            fe.enclosure(enc.get("href"), enc.get("length"), enc.get("type"))
+    # Drop null or href-less enclosures up front; they have nothing to point at
+    for enc in (e for e in entry.get("enclosures", ()) if e and e.get("href")):
+        fe.enclosure(enc.get("href"), enc.get("length"), enc.get("type"))
 
 
 def _load_existing_entries(output_path: Path) -> tuple[list[feedparser.FeedParserDict], set[str]]:
@@ -113,39 +332,130 @@ def _load_existing_entries(output_path: Path) -> tuple[list[feedparser.FeedParse
     return existing_entries, existing_ids
 
 
+# Adaptive polling: weight given to the newest observed update interval, and
+# the longest a feed may go unpolled however rarely it has changed (1 day).
+_EWMA_WEIGHT = 0.3
+_MAX_POLL_INTERVAL = 86400.0
+
+
+def _meta_path(output_path: Path) -> Path:
+    """Return the path of the metadata sidecar kept next to an output feed."""
+    return output_path.with_name(output_path.name + ".meta.json")
+
+
+def _load_meta(output_path: Path) -> dict[str, Any]:
+    """Load sidecar metadata for an output feed, or {} if none is usable."""
+    try:
+        with open(_meta_path(output_path), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
+
+def _save_meta(output_path: Path, meta: dict[str, Any]) -> None:
+    """Write sidecar metadata for an output feed."""
+    with open(_meta_path(output_path), "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+
+
+def _config_digest(cfg: FeedConfig) -> str:
+    """Return a SHA-256 over the config fields that shape a feed's output.
+
+    Keyword lists are casefolded and sorted, matching how they are applied,
+    so only edits that can change the result produce a new digest.
+    """
+    normalized = {
+        "include": sorted(kw.casefold() for kw in cfg.include),
+        "exclude": sorted(kw.casefold() for kw in cfg.exclude),
+        "title": cfg.title,
+        "description": cfg.description,
+        "private": cfg.private,
+    }
+    return hashlib.sha256(
+        json.dumps(normalized, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _poll_due(cfg: FeedConfig, meta: dict[str, Any], now: float) -> bool:
+    """Return False while an adaptively polled feed is still inside its window.
+
+    The window is the feed's average update interval capped at
+    _MAX_POLL_INTERVAL, never shorter than cfg.min_poll_interval.
+    """
+    last_seen = meta.get("last_update_seen")
+    ewma = meta.get("ewma_interval")
+    if not cfg.adaptive_poll or last_seen is None or ewma is None:
+        return True
+    window = max(cfg.min_poll_interval, min(ewma, _MAX_POLL_INTERVAL))
+    return now - last_seen >= window
+
+
+def _record_update(meta: dict[str, Any], update_time: float) -> None:
+    """Fold a newly observed update time into the interval moving average."""
+    last_seen = meta.get("last_update_seen")
+    if last_seen is not None and update_time > last_seen:
+        interval = update_time - last_seen
+        ewma = meta.get("ewma_interval")
+        meta["ewma_interval"] = (
+            interval if ewma is None
+            else (1 - _EWMA_WEIGHT) * ewma + _EWMA_WEIGHT * interval
+        )
+    if last_seen is None or update_time > last_seen:
+        meta["last_update_seen"] = update_time
+
+
 def _fetch_remote_feed(cfg: FeedConfig, use_conditional_fetch: bool,
-                      file_mtime: float | None
-                      ) -> tuple[feedparser.util.FeedParserDict | None, float | None]:
-    """Fetch remote feed with conditional fetching if enabled."""
+                      file_mtime: float | None, previous_digest: str | None = None
+                      ) -> tuple[feedparser.util.FeedParserDict | None, float | None,
+                                 str | None]:
+    """Fetch remote feed with conditional fetching if enabled.
+
+    Returns (remote, last_modified_ts, body_digest). remote is None when the
+    server answered 304 or returned a body whose SHA-256 matches
+    previous_digest, so callers can skip parsing entirely.
+    """
     last_modified_ts = None
+    body_digest = None
 
     if use_conditional_fetch:
         try:
             content, last_modified_ts = _conditional_fetch(cfg.url, file_mtime)
             if content is None:
                 # Feed hasn't been modified, return None to signal early exit
-                return None, None
-            remote = feedparser.parse(content)
+                return None, None, None
+            body_digest = hashlib.sha256(content).hexdigest()
+            if body_digest == previous_digest:
+                # Same bytes as the last processed body; nothing can be new
+                return None, None, body_digest
+            remote = _fast_parse(content) if cfg.fast_parse else feedparser.parse(content)
         except (requests.RequestException, ValueError) as e:
             print(f"Warning: Conditional fetch failed for {cfg.url}: {e}")
             print("Falling back to regular fetch...")
+            body_digest = None
             remote = feedparser.parse(cfg.url)
     else:
         remote = feedparser.parse(cfg.url)
 
-    return remote, last_modified_ts
+    return remote, last_modified_ts, body_digest
 
 
 def _filter_new_entries(remote_entries: list, existing_ids: set[str],
                        cfg: FeedConfig) -> list[feedparser.FeedParserDict]:
     """Filter remote entries for new items that pass include/exclude criteria."""
+    # Resolved once here rather than looked up again for every entry
+    include = _keyword_matcher(cfg.include)
+    exclude = _keyword_matcher(cfg.exclude)
+    # One set covers both the existing output and IDs accepted earlier in
+    # this fetch, so a feed that repeats an item only contributes it once.
+    seen = set(existing_ids)
     new_entries = []
     for entry in remote_entries:
         entry_id = entry.get('id') or entry.get('link')
         # Skip entries without valid IDs or entries that already exist
-        if entry_id is None or str(entry_id) in existing_ids:
+        if entry_id is None or str(entry_id) in seen:
             continue
-        if _entry_passes(entry, cfg.include, cfg.exclude):
+        if _content_passes(_entry_haystack(entry), include, exclude):
+            seen.add(str(entry_id))
             new_entries.append(entry)
     return new_entries
 
@@ -193,8 +503,16 @@ def _update_file_timestamp(output_path: Path, last_modified_ts: float | None) ->
         os.utime(output_path, (last_modified_ts, last_modified_ts))
 
 
-def process_feed(cfg: FeedConfig, no_check_modified: bool = False):
-    """Process a single feed: download, filter, and generate output feed."""
+def process_feed(cfg: FeedConfig, no_check_modified: bool = False, *,
+                 source: feedparser.FeedParserDict | None = None):
+    """Process a single feed: download, filter, and generate output feed.
+
+    Args:
+        cfg: Feed configuration
+        no_check_modified: Disable conditional fetching for this run
+        source: Already-parsed source feed; when given, cfg.url is not
+            fetched and polling/conditional-fetch state is left untouched
+    """
     output_path = Path(cfg.output)
 
     # Load existing entries and determine conditional fetch settings
@@ -205,12 +523,26 @@ def process_feed(cfg: FeedConfig, no_check_modified: bool = False):
         if (output_path.exists() and use_conditional_fetch)
         else None
     )
-
-    # Fetch remote feed
-    remote, last_modified_ts = _fetch_remote_feed(cfg, use_conditional_fetch, file_mtime)
-    if remote is None:
-        # Feed hasn't been modified, nothing to do
+    meta = _load_meta(output_path) if file_mtime is not None else {}
+    # A stored body digest only counts if the config that produced the
+    # output is unchanged; edited filters must be applied to the same body
+    config_digest = _config_digest(cfg)
+    previous_digest = (
+        meta.get("body_sha256")
+        if meta.get("config_sha256") == config_digest
+        else None
+    )
+    if source is not None:
+        remote, last_modified_ts, body_digest = source, None, None
+    elif not _poll_due(cfg, meta, time.time()):
         return
+    else:
+        # Fetch remote feed
+        remote, last_modified_ts, body_digest = _fetch_remote_feed(
+            cfg, use_conditional_fetch, file_mtime, previous_digest)
+        if remote is None:
+            # Feed hasn't been modified, nothing to do
+            return
 
     remote_feed = cast(feedparser.FeedParserDict, remote.feed)
 
@@ -229,6 +561,49 @@ def process_feed(cfg: FeedConfig, no_check_modified: bool = False):
     output_path.parent.mkdir(parents=True, exist_ok=True)
     fg.rss_file(str(output_path))
 
+    # Remember the processed body and config so a byte-identical 200 can be
+    # skipped, and when it changed so adaptive polling can learn the feed's
+    # cadence
+    if body_digest is not None:
+        meta["body_sha256"] = body_digest
+        meta["config_sha256"] = config_digest
+        _record_update(
+            meta, last_modified_ts if last_modified_ts is not None else time.time())
+        _save_meta(output_path, meta)
+
     # Update file timestamp if needed
     if use_conditional_fetch and new_entries:
         _update_file_timestamp(output_path, last_modified_ts)
+
+
+def _fetch_source(url: str, fast_parse: bool) -> feedparser.FeedParserDict:
+    """Fetch and parse a source feed in full for process_feeds_batch()."""
+    if fast_parse:
+        try:
+            resp = requests.get(url, timeout=30)
+            resp.raise_for_status()
+            return _fast_parse(resp.content)
+        except requests.RequestException as e:
+            print(f"Warning: Fetch failed for {url}: {e}")
+            print("Falling back to regular fetch...")
+    return feedparser.parse(url)
+
+
+def process_feeds_batch(cfgs: Iterable[FeedConfig]) -> None:
+    """Process several feeds, fetching and parsing each source URL once.
+
+    Configs sharing a url (such as the splits of one feed) are filtered
+    against a single parse of it, made with _fast_parse() when they set
+    fast_parse (configs of one url that disagree get one parse each).
+    Sources are always fetched in full: conditional-fetch and adaptive-poll
+    state belongs to each output, so use process_feed() per config where
+    that matters more.
+    """
+    by_source: dict[tuple[str, bool], list[FeedConfig]] = {}
+    for cfg in cfgs:
+        by_source.setdefault((cfg.url, cfg.fast_parse), []).append(cfg)
+
+    for (url, fast_parse), group in by_source.items():
+        source = _fetch_source(url, fast_parse)
+        for cfg in group:
+            process_feed(cfg, source=source)
@@ -5,21 +5,35 @@ mock RSS feeds, feedparser.parse() monkeypatching for network-free
 testing, and helper functions for creating test data. Central location
 for all test setup and configuration utilities.
 """
+import hashlib
 import os
 import tempfile
 import shutil
+import xml.etree.ElementTree as ET
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Dict, Any
 
 import pytest
 import yaml
 import feedparser
+from feedgen.feed import FeedGenerator
+
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
 
 
 # Test data directory
 TEST_DATA_DIR = Path(__file__).parent / "data"
 
 
+def _parse_yaml(path: Path) -> Any:
+    """Parse a YAML file with the loader class bound once at import."""
+    return yaml.load(path.read_bytes(), Loader=YamlLoader)
+
+
 @pytest.fixture
 def test_data_dir():
     """Provide the path to the test data directory."""
@@ -38,8 +52,7 @@ def sample_yaml_config():
     """Load a sample YAML configuration from test data."""
     yaml_file = TEST_DATA_DIR / "sample_config.yaml"
     if yaml_file.exists():
-        with open(yaml_file, 'r') as f:
-            return yaml.safe_load(f)
+        return _parse_yaml(yaml_file)
     return None
 
 
@@ -89,6 +102,18 @@ def mock_feeds_config():
     }
 
 
+@pytest.fixture
+def fg():
+    """Provide a FeedGenerator with the podcast extension and required
+    channel fields set, ready for entries to be added."""
+    generator = FeedGenerator()
+    generator.load_extension('podcast')
+    generator.title('Test Feed')
+    generator.link(href='http://example.com')
+    generator.description('Test feed description')
+    return generator
+
+
 @pytest.fixture
 def mock_rss_item():
     """Provide a mock RSS item for testing."""
@@ -186,10 +211,32 @@ def create_mock_rss(title: str = "Test Podcast", description: str = "Test Descri
     return rss_template.format(title=title, description=description, link=link, items=items_xml)
 
 
+def read_rss(path: str | Path) -> SimpleNamespace:
+    """Read a generated RSS file for assertions without feedparser.
+
+    A plain ElementTree walk, independent of the code under test, giving
+    ``feed.title``/``feed.description`` and ``entries`` with a ``title``
+    each. Values are the element text as written.
+    """
+    channel = ET.parse(path).getroot().find("channel")
+    return SimpleNamespace(
+        feed=SimpleNamespace(title=channel.findtext("title"),
+                             description=channel.findtext("description")),
+        entries=[SimpleNamespace(title=item.findtext("title"))
+                 for item in channel.iter("item")],
+    )
+
+
 # Config fixture helpers
 CONFIG_DIR = TEST_DATA_DIR / "configs"
 
 
+@pytest.fixture(scope="session")
+def parsed_mock_feed():
+    """Default create_mock_rss() feed, parsed once; must not be mutated."""
+    return feedparser.parse(create_mock_rss().encode("utf-8"))
+
+
 @pytest.fixture
 def config_files():
     """Provide paths to all available config files."""
@@ -203,6 +250,66 @@ def config_files():
     }
 
 
+@pytest.fixture(scope="session")
+def yaml_parse_cache():
+    """Session-wide store of parsed YAML keyed by (path, mtime_ns)."""
+    return {}
+
+
+@pytest.fixture
+def load_cached(yaml_parse_cache):
+    """Return a loader that parses each YAML file at most once per session.
+
+    Parsed objects are shared between tests and must not be mutated.
+    Parse errors are not cached, so they are raised on every call.
+    """
+    def _load(path: Path) -> Any:
+        key = (str(path), path.stat().st_mtime_ns)
+        if key not in yaml_parse_cache:
+            yaml_parse_cache[key] = _parse_yaml(path)
+        return yaml_parse_cache[key]
+
+    return _load
+
+
+@pytest.fixture(scope="session")
+def make_feed_yaml(tmp_path_factory):
+    """Return a builder that writes a single-feed config and returns its path.
+
+    Named fields passed as None are left out of the feed; extra keyword
+    fields are written as given, so private=None emits "private: null".
+    Identical configs are written once per session and share a path, so
+    callers must not modify the returned file.
+    """
+    config_dir = tmp_path_factory.mktemp("feed_yaml")
+
+    def _make(url: str, output: str | None = None,
+              include: list | None = None, exclude: list | None = None,
+              title: str | None = None, description: str | None = None,
+              splits: list | None = None, **extra: Any) -> Path:
+        named = {
+            "url": url,
+            "output": output,
+            "include": include,
+            "exclude": exclude,
+            "title": title,
+            "description": description,
+            "splits": splits,
+        }
+        feed = {k: v for k, v in named.items() if v is not None}
+        feed.update(extra)
+        content = yaml.dump(
+            {"feeds": [feed]},
+            Dumper=YamlDumper, sort_keys=False)
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+        config_path = config_dir / f"{digest}.yaml"
+        if not config_path.exists():
+            config_path.write_text(content)
+        return config_path
+
+    return _make
+
+
 @pytest.fixture
 def temp_config_from_fixture(tmp_path):
     """Helper to copy a config fixture to a temporary path.
@@ -227,93 +334,92 @@ def temp_config_from_fixture(tmp_path):
 
         temp_config_path = tmp_path / f"{config_name}.yaml"
         shutil.copy2(config_path, temp_config_path)
+        assert temp_config_path.exists()
         return temp_config_path
 
     return _copy_config
 
 
-@pytest.fixture
-def basic_include_exclude_config(tmp_path):
-    """Copy basic include/exclude config to tmp_path and return the path."""
-    config_path = CONFIG_DIR / "basic_include_exclude.yaml"
-    temp_config_path = tmp_path / "basic_include_exclude.yaml"
-    shutil.copy2(config_path, temp_config_path)
-    return temp_config_path
+CONFIG_FIXTURE_NAMES = [
+    "basic_include_exclude",
+    "splits_config",
+    "missing_keys",
+    "bad_syntax",
+    "empty_config",
+    "complex_config"
+]
 
 
-@pytest.fixture
-def splits_config(tmp_path):
-    """Copy splits config to tmp_path and return the path."""
-    config_path = CONFIG_DIR / "splits_config.yaml"
-    temp_config_path = tmp_path / "splits_config.yaml"
-    shutil.copy2(config_path, temp_config_path)
-    return temp_config_path
+@pytest.fixture(scope="session")
+def session_config_copies(tmp_path_factory):
+    """Copy every config fixture once per session and return their paths.
 
+    The copies are shared by all tests, so consumers must only read them.
+    """
+    config_dir = tmp_path_factory.mktemp("fixtures", numbered=False)
+    configs = {}
+    for config_name in CONFIG_FIXTURE_NAMES:
+        temp_config_path = config_dir / f"{config_name}.yaml"
+        shutil.copy2(CONFIG_DIR / f"{config_name}.yaml", temp_config_path)
+        assert temp_config_path.exists()
+        configs[config_name] = temp_config_path
+    return configs
 
-@pytest.fixture
-def missing_keys_config(tmp_path):
-    """Copy config with missing keys to tmp_path and return the path."""
-    config_path = CONFIG_DIR / "missing_keys.yaml"
-    temp_config_path = tmp_path / "missing_keys.yaml"
-    shutil.copy2(config_path, temp_config_path)
-    return temp_config_path
 
+@pytest.fixture(scope="session")
+def basic_include_exclude_config(session_config_copies):
+    """Return the session copy of the basic include/exclude config."""
+    return session_config_copies["basic_include_exclude"]
 
-@pytest.fixture
-def bad_syntax_config(tmp_path):
-    """Copy config with bad syntax to tmp_path and return the path."""
-    config_path = CONFIG_DIR / "bad_syntax.yaml"
-    temp_config_path = tmp_path / "bad_syntax.yaml"
-    shutil.copy2(config_path, temp_config_path)
-    return temp_config_path
 
+@pytest.fixture(scope="session")
+def splits_config(session_config_copies):
+    """Return the session copy of the splits config."""
+    return session_config_copies["splits_config"]
 
-@pytest.fixture
-def empty_config(tmp_path):
-    """Copy empty config to tmp_path and return the path."""
-    config_path = CONFIG_DIR / "empty_config.yaml"
-    temp_config_path = tmp_path / "empty_config.yaml"
-    shutil.copy2(config_path, temp_config_path)
-    return temp_config_path
 
+@pytest.fixture(scope="session")
+def missing_keys_config(session_config_copies):
+    """Return the session copy of the config with missing keys."""
+    return session_config_copies["missing_keys"]
 
-@pytest.fixture
-def complex_config(tmp_path):
-    """Copy complex config to tmp_path and return the path."""
-    config_path = CONFIG_DIR / "complex_config.yaml"
-    temp_config_path = tmp_path / "complex_config.yaml"
-    shutil.copy2(config_path, temp_config_path)
-    return temp_config_path
 
+@pytest.fixture(scope="session")
+def bad_syntax_config(session_config_copies):
+    """Return the session copy of the config with bad syntax."""
+    return session_config_copies["bad_syntax"]
 
-@pytest.fixture
-def all_temp_configs(tmp_path):
-    """Copy all config fixtures to tmp_path and return a dict of paths."""
-    configs = {}
-    config_names = [
-        "basic_include_exclude",
-        "splits_config",
-        "missing_keys",
-        "bad_syntax",
-        "empty_config",
-        "complex_config"
-    ]
-
-    for config_name in config_names:
-        config_path = CONFIG_DIR / f"{config_name}.yaml"
-        temp_config_path = tmp_path / f"{config_name}.yaml"
-        shutil.copy2(config_path, temp_config_path)
-        configs[config_name] = temp_config_path
 
-    return configs
+@pytest.fixture(scope="session")
+def empty_config(session_config_copies):
+    """Return the session copy of the empty config."""
+    return session_config_copies["empty_config"]
+
+
+@pytest.fixture(scope="session")
+def complex_config(session_config_copies):
+    """Return the session copy of the complex config."""
+    return session_config_copies["complex_config"]
+
+
+@pytest.fixture(scope="session")
+def all_temp_configs(session_config_copies):
+    """Return a dict of the session copies of all config fixtures."""
+    return dict(session_config_copies)
 
 
 # Feedparser monkeypatch fixture
 FEED_FILES_DIR = TEST_DATA_DIR / "feeds"
 
 
+@pytest.fixture(scope="session")
+def parsed_test_feed_cache():
+    """Session-wide cache of parsed static feeds, keyed by test URL."""
+    return {}
+
+
 @pytest.fixture
-def mock_feedparser_parse(monkeypatch):
+def mock_feedparser_parse(monkeypatch, parsed_test_feed_cache):
     """Monkeypatch feedparser.parse to return pre-parsed objects from
     static XML files.
 
@@ -330,6 +436,9 @@ def mock_feedparser_parse(monkeypatch):
     - http://test/complex -> complex_feed.xml
 
     For any other URL, the original feedparser.parse is called.
+
+    Each static file is parsed once per session and the same result object
+    is returned on every later call, so treat it as read-only.
     """
     original_parse = feedparser.parse
 
@@ -354,10 +463,15 @@ def mock_feedparser_parse(monkeypatch):
             xml_filename = test_url_mapping[url_or_file]
             xml_file_path = FEED_FILES_DIR / xml_filename
 
+            if url_or_file in parsed_test_feed_cache:
+                return parsed_test_feed_cache[url_or_file]
+
             if xml_file_path.exists():
-                # Parse the static XML file instead of making a network request
-                return original_parse(
-                    str(xml_file_path),
+                # Parse the static XML file instead of making a network
+                # request; handing over bytes skips feedparser's URL/file
+                # handler dispatch
+                parsed = original_parse(
+                    xml_file_path.read_bytes(),
                     etag=etag,
                     modified=modified,
                     agent=agent,
@@ -367,6 +481,8 @@ def mock_feedparser_parse(monkeypatch):
                     response_headers=response_headers,
                     resolve_relative_uris=resolve_relative_uris,
                     sanitize_html=sanitize_html)
+                parsed_test_feed_cache[url_or_file] = parsed
+                return parsed
             else:
                 # If the XML file doesn't exist, return an empty feed
                 empty_feed_xml = '''<?xml version="1.0" encoding="UTF-8"?>
@@ -412,5 +528,32 @@ def test_feed_urls():
     }
 
 
+@pytest.fixture(scope="session")
+def large_feed_data():
+    """Provide raw data for a 1000-episode feed, built once per session.
+
+    Even-numbered episodes are "Tech Talk", odd ones "Sports Content".
+    Entries are a tuple so tests sharing the data cannot append to it;
+    wrap it in feedparser.FeedParserDict to use it as a parse result.
+    """
+    return {
+        'entries': tuple(
+            {
+                'id': f'episode_{i}',
+                'title': f'Episode {i}: Tech Talk' if i % 2 == 0 else f'Episode {i}: Sports Content',
+                'description': f'Description for episode {i}',
+                'link': f'https://example.com/episode_{i}',
+                'published': 'Mon, 01 Jan 2024 10:00:00 +0000'
+            }
+            for i in range(1000)
+        ),
+        'feed': {
+            'title': 'Large Test Podcast',
+            'description': 'A large test podcast',
+            'link': 'https://example.com/large-feed'
+        }
+    }
+
+
 # Test markers for convenience
 pytestmark = pytest.mark.unit
@@ -16,6 +16,7 @@ import yaml
 from podfeedfilter.__main__ import main
 
 
+@pytest.mark.slow
 def test_cli_subprocess_with_basic_config(tmp_path):
     """Test CLI invocation via subprocess.run with basic config."""
     # Create a test config file - use a URL that doesn't require mocking
@@ -40,7 +41,7 @@ def test_cli_subprocess_with_basic_config(tmp_path):
     result = subprocess.run([
         sys.executable, "-m", "podfeedfilter",
         "-c", str(config_path)
-    ], capture_output=True, text=True)
+    ], capture_output=True, check=False)
 
     # Check command executed successfully (it should exit cleanly even if no
     # files are created)
@@ -53,6 +54,7 @@ def test_cli_subprocess_with_basic_config(tmp_path):
     # This test verifies the CLI interface works correctly
 
 
+@pytest.mark.slow
 def test_cli_subprocess_with_splits_config(tmp_path):
     """Test CLI invocation via subprocess.run with splits configuration."""
     # Create a test config with splits - use non-existent URL for subprocess
@@ -89,7 +91,7 @@ def test_cli_subprocess_with_splits_config(tmp_path):
     result = subprocess.run([
         sys.executable, "-m", "podfeedfilter",
         "-c", str(config_path)
-    ], capture_output=True, text=True, check=False)
+    ], capture_output=True, check=False)
 
     # Check command executed successfully (should exit cleanly even if no files
     # created)
@@ -103,6 +105,7 @@ def test_cli_subprocess_with_splits_config(tmp_path):
     # configuration
 
 
+@pytest.mark.slow
 def test_cli_subprocess_with_nonexistent_config(tmp_path):
     """Test CLI invocation via subprocess.run with non-existent config file."""
     nonexistent_config = tmp_path / "nonexistent.yaml"
@@ -111,18 +114,19 @@ def test_cli_subprocess_with_nonexistent_config(tmp_path):
     result = subprocess.run([
         sys.executable, "-m", "podfeedfilter",
         "-c", str(nonexistent_config)
-    ], capture_output=True, text=True, check=False)
+    ], capture_output=True, check=False)
 
     # Check command failed as expected
     assert result.returncode != 0, (
         "Command should have failed with non-existent config"
     )
     assert (
-        "No such file or directory" in result.stderr or
-        "FileNotFoundError" in result.stderr
+        b"No such file or directory" in result.stderr or
+        b"FileNotFoundError" in result.stderr
     )
 
 
+@pytest.mark.slow
 def test_cli_subprocess_with_invalid_config(tmp_path):
     """Test CLI invocation via subprocess.run with invalid YAML config."""
     # Create invalid YAML config
@@ -134,7 +138,7 @@ def test_cli_subprocess_with_invalid_config(tmp_path):
     result = subprocess.run([
         sys.executable, "-m", "podfeedfilter",
         "-c", str(invalid_config)
-    ], capture_output=True, text=True, check=False)
+    ], capture_output=True, check=False)
 
     # Check command failed as expected
     assert result.returncode != 0, (
@@ -180,16 +184,16 @@ def test_cli_direct_main_call_with_basic_config(tmp_path,
 
     # Verify the output file contains valid XML (handle both single and double
     # quotes)
-    content = output_file.read_text()
+    content = output_file.read_bytes()
     assert (
-        '<?xml version="1.0" encoding="UTF-8"?>' in content or
-        "<?xml version='1.0' encoding='UTF-8'?>" in content
+        b'<?xml version="1.0" encoding="UTF-8"?>' in content or
+        b"<?xml version='1.0' encoding='UTF-8'?>" in content
     ), (
         f"XML declaration not found in: {content[:200]}..."
     )
     assert (
-        'version="2.0"' in content or
-        "version='2.0'" in content
+        b'version="2.0"' in content or
+        b"version='2.0'" in content
     ), (
         f"RSS version not found in: {content[:200]}..."
     )
@@ -247,16 +251,16 @@ def test_cli_direct_main_call_with_splits_config(tmp_path,
 
         # Verify the output file contains valid XML (handle both single and
         # double quotes)
-        content = output_file.read_text()
+        content = output_file.read_bytes()
         assert (
-            '<?xml version="1.0" encoding="UTF-8"?>' in content or
-            "<?xml version='1.0' encoding='UTF-8'?>" in content
+            b'<?xml version="1.0" encoding="UTF-8"?>' in content or
+            b"<?xml version='1.0' encoding='UTF-8'?>" in content
         ), (
             f"XML declaration not found in: {content[:200]}..."
         )
         assert (
-            'version="2.0"' in content or
-            "version='2.0'" in content
+            b'version="2.0"' in content or
+            b"version='2.0'" in content
         ), (
             f"RSS version not found in: {content[:200]}..."
         )
@@ -302,16 +306,16 @@ def test_cli_direct_main_call_with_default_config(tmp_path,
 
     # Verify the output file contains valid XML
     # (handle both single and double quotes)
-    content = output_file.read_text()
+    content = output_file.read_bytes()
     assert (
-        '<?xml version="1.0" encoding="UTF-8"?>' in content or
-        "<?xml version='1.0' encoding='UTF-8'?>" in content
+        b'<?xml version="1.0" encoding="UTF-8"?>' in content or
+        b"<?xml version='1.0' encoding='UTF-8'?>" in content
     ), (
         f"XML declaration not found in: {content[:200]}..."
     )
     assert (
-        'version="2.0"' in content or
-        "version='2.0'" in content
+        b'version="2.0"' in content or
+        b"version='2.0'" in content
     ), (
         f"RSS version not found in: {content[:200]}..."
     )
@@ -348,12 +352,13 @@ def test_cli_direct_main_call_with_invalid_config(tmp_path, monkeypatch,
         main()
 
 
+@pytest.mark.slow
 def test_cli_help_flag_subprocess():
     """Test CLI help flag via subprocess.run."""
     result = subprocess.run([
         sys.executable, "-m", "podfeedfilter",
         "--help"
-    ], capture_output=True, text=True, check=False)
+    ], capture_output=True, check=False)
 
     # Check command executed successfully
     assert result.returncode == 0, (
@@ -361,8 +366,8 @@ def test_cli_help_flag_subprocess():
     )
 
     # Check help text contains expected content
-    assert "Filter podcast feeds" in result.stdout
-    assert "--config" in result.stdout or "-c" in result.stdout
+    assert b"Filter podcast feeds" in result.stdout
+    assert b"--config" in result.stdout or b"-c" in result.stdout
 
 
 def test_cli_help_flag_direct_main(monkeypatch, capsys):
@@ -7,80 +7,87 @@ Tests verify:
 - Per-feed check_modified configuration option
 - Error handling and fallback to regular fetching
 """
+import functools
+import gzip
 import os
 import tempfile
 import time
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import patch
 import shutil
 
+import feedparser
 import pytest
-import responses
 from freezegun import freeze_time
 
 from podfeedfilter.config import FeedConfig
-from podfeedfilter.filterer import process_feed, _conditional_fetch
+from podfeedfilter.filterer import (
+    process_feed, _conditional_fetch, _load_meta, _meta_path, _save_meta,
+    _poll_due, _record_update, _config_digest, _MAX_POLL_INTERVAL
+)
 
 
-# Sample RSS feed content for testing
-SAMPLE_RSS_CONTENT = b"""<?xml version="1.0" encoding="UTF-8"?>
-<rss version="2.0">
-  <channel>
-    <title>Test Podcast</title>
-    <link>https://example.com/podcast</link>
-    <description>A test podcast</description>
+# Path served by the pytest-httpserver loopback server
+FEED_PATH = "/feed.rss"
 
-    <item>
-      <title>Episode 1: Introduction</title>
-      <link>https://example.com/ep1</link>
-      <guid>ep1</guid>
-      <description>The first episode</description>
-      <pubDate>Mon, 01 Jan 2024 10:00:00 GMT</pubDate>
-      <enclosure url="https://example.com/ep1.mp3" length="5000000" type="audio/mpeg"/>
-    </item>
-  </channel>
-</rss>"""
+# Skeleton of an existing output feed with no episodes
+_EMPTY_FEED = b"<?xml version='1.0'?><rss><channel></channel></rss>"
 
-UPDATED_RSS_CONTENT = b"""<?xml version="1.0" encoding="UTF-8"?>
-<rss version="2.0">
-  <channel>
-    <title>Test Podcast</title>
-    <link>https://example.com/podcast</link>
-    <description>A test podcast</description>
+# Sample RSS feed content for testing, kept gzipped under tests/data/feeds
+FEED_FIXTURES_DIR = Path(__file__).parent / "data" / "feeds"
 
-    <item>
-      <title>Episode 2: Second Episode</title>
-      <link>https://example.com/ep2</link>
-      <guid>ep2</guid>
-      <description>The second episode</description>
-      <pubDate>Tue, 02 Jan 2024 10:00:00 GMT</pubDate>
-      <enclosure url="https://example.com/ep2.mp3" length="6000000" type="audio/mpeg"/>
-    </item>
 
-    <item>
-      <title>Episode 1: Introduction</title>
-      <link>https://example.com/ep1</link>
-      <guid>ep1</guid>
-      <description>The first episode</description>
-      <pubDate>Mon, 01 Jan 2024 10:00:00 GMT</pubDate>
-      <enclosure url="https://example.com/ep1.mp3" length="5000000" type="audio/mpeg"/>
-    </item>
-  </channel>
-</rss>"""
+@functools.cache
+def _load_feed_fixture(name: str) -> bytes:
+    """Decompress a gzipped feed fixture once per interpreter."""
+    return gzip.decompress((FEED_FIXTURES_DIR / name).read_bytes())
+
+
+# Single episode (ep1)
+SAMPLE_RSS_CONTENT = _load_feed_fixture("conditional_sample.rss.gz")
+
+# Adds ep2 ahead of ep1
+UPDATED_RSS_CONTENT = _load_feed_fixture("conditional_updated.rss.gz")
+
+# ep1 relies on a permalink guid for its link
+PERMALINK_RSS_CONTENT = UPDATED_RSS_CONTENT.replace(
+    b"<link>https://example.com/ep1</link>\n      <guid>ep1</guid>",
+    b"<guid>https://example.com/ep1</guid>",
+)
+
+# As above, and ep2 gains the namespaced show notes, creator and iTunes
+# metadata a typical podcast feed carries
+NAMESPACED_RSS_CONTENT = PERMALINK_RSS_CONTENT.replace(
+    b'<rss version="2.0">',
+    b'<rss version="2.0" '
+    b'xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd" '
+    b'xmlns:content="http://purl.org/rss/1.0/modules/content/" '
+    b'xmlns:dc="http://purl.org/dc/elements/1.1/">',
+).replace(
+    b"<guid>ep2</guid>",
+    b"<guid>ep2</guid><dc:creator>Jane Host</dc:creator>"
+    b"<itunes:duration>12:34</itunes:duration>"
+    b"<itunes:explicit>no</itunes:explicit>"
+    b"<content:encoded><![CDATA[<p>Show notes</p>]]></content:encoded>",
+)
+
+# As above, plus an element _fast_parse hands to feedparser
+ITUNES_SUMMARY_RSS_CONTENT = NAMESPACED_RSS_CONTENT.replace(
+    b"<itunes:duration>",
+    b"<itunes:summary>Episode summary</itunes:summary><itunes:duration>",
+)
 
 
 class TestConditionalFetch:
     """Test the _conditional_fetch helper function."""
 
-    @responses.activate
-    def test_conditional_fetch_304_not_modified(self):
+    def test_conditional_fetch_304_not_modified(self, httpserver):
         """Test that 304 Not Modified returns None."""
-        url = "https://example.com/feed.rss"
+        url = httpserver.url_for(FEED_PATH)
         since = 1704110400.0  # Jan 1, 2024 12:00:00 GMT
 
-        responses.add(
-            responses.GET,
-            url,
+        httpserver.expect_request(FEED_PATH).respond_with_data(
             status=304
         )
 
@@ -88,20 +95,17 @@ class TestConditionalFetch:
 
         assert content is None
         assert last_modified is None
-        assert len(responses.calls) == 1
-        assert "If-Modified-Since" in responses.calls[0].request.headers
+        assert len(httpserver.log) == 1
+        assert "If-Modified-Since" in httpserver.log[0][0].headers
 
-    @responses.activate
-    def test_conditional_fetch_200_with_last_modified(self):
+    def test_conditional_fetch_200_with_last_modified(self, httpserver):
         """Test successful fetch with Last-Modified header."""
-        url = "https://example.com/feed.rss"
+        url = httpserver.url_for(FEED_PATH)
         since = 1704110400.0  # Jan 1, 2024 12:00:00 GMT
         last_modified_str = "Mon, 02 Jan 2024 12:00:00 GMT"
 
-        responses.add(
-            responses.GET,
-            url,
-            body=SAMPLE_RSS_CONTENT,
+        httpserver.expect_request(FEED_PATH).respond_with_data(
+            SAMPLE_RSS_CONTENT,
             headers={"Last-Modified": last_modified_str},
             status=200
         )
@@ -110,18 +114,15 @@ class TestConditionalFetch:
 
         assert content == SAMPLE_RSS_CONTENT
         assert last_modified == 1704196800.0  # Jan 2, 2024 12:00:00 GMT
-        assert len(responses.calls) == 1
+        assert len(httpserver.log) == 1
 
-    @responses.activate
-    def test_conditional_fetch_200_without_last_modified(self):
+    def test_conditional_fetch_200_without_last_modified(self, httpserver):
         """Test successful fetch without Last-Modified header."""
-        url = "https://example.com/feed.rss"
+        url = httpserver.url_for(FEED_PATH)
         since = 1704110400.0
 
-        responses.add(
-            responses.GET,
-            url,
-            body=SAMPLE_RSS_CONTENT,
+        httpserver.expect_request(FEED_PATH).respond_with_data(
+            SAMPLE_RSS_CONTENT,
             status=200
         )
 
@@ -130,32 +131,26 @@ class TestConditionalFetch:
         assert content == SAMPLE_RSS_CONTENT
         assert last_modified is None
 
-    @responses.activate
-    def test_conditional_fetch_no_since_parameter(self):
+    def test_conditional_fetch_no_since_parameter(self, httpserver):
         """Test fetch without If-Modified-Since header when since is None."""
-        url = "https://example.com/feed.rss"
+        url = httpserver.url_for(FEED_PATH)
 
-        responses.add(
-            responses.GET,
-            url,
-            body=SAMPLE_RSS_CONTENT,
+        httpserver.expect_request(FEED_PATH).respond_with_data(
+            SAMPLE_RSS_CONTENT,
             status=200
         )
 
         content, last_modified = _conditional_fetch(url, None)
 
         assert content == SAMPLE_RSS_CONTENT
-        assert "If-Modified-Since" not in responses.calls[0].request.headers
+        assert "If-Modified-Since" not in httpserver.log[0][0].headers
 
-    @responses.activate
-    def test_conditional_fetch_invalid_last_modified(self):
+    def test_conditional_fetch_invalid_last_modified(self, httpserver):
         """Test handling of invalid Last-Modified header."""
-        url = "https://example.com/feed.rss"
+        url = httpserver.url_for(FEED_PATH)
 
-        responses.add(
-            responses.GET,
-            url,
-            body=SAMPLE_RSS_CONTENT,
+        httpserver.expect_request(FEED_PATH).respond_with_data(
+            SAMPLE_RSS_CONTENT,
             headers={"Last-Modified": "invalid-date-string"},
             status=200
         )
@@ -173,24 +168,25 @@ class TestProcessFeedConditional:
         """Set up test fixtures."""
         self.temp_dir = Path(tempfile.mkdtemp())
         self.output_path = self.temp_dir / "test_feed.xml"
-        self.url = "https://example.com/feed.rss"
 
     def teardown_method(self):
         """Clean up test fixtures."""
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
-    @responses.activate
-    def test_process_feed_304_not_modified_early_return(self):
+    @pytest.fixture(autouse=True)
+    def _feed_url(self, httpserver):
+        """Point the feed URL at the loopback test server."""
+        self.url = httpserver.url_for(FEED_PATH)
+
+    def test_process_feed_304_not_modified_early_return(self, httpserver):
         """Test that 304 Not Modified causes early return without processing."""
         # Create an existing output file with a known timestamp
-        self.output_path.write_text("<?xml version='1.0'?><rss><channel></channel></rss>")
+        self.output_path.write_bytes(_EMPTY_FEED)
         file_time = 1704110400.0  # Jan 1, 2024
         os.utime(self.output_path, (file_time, file_time))
 
         # Mock 304 Not Modified response
-        responses.add(
-            responses.GET,
-            self.url,
+        httpserver.expect_request(FEED_PATH).respond_with_data(
             status=304
         )
 
@@ -201,32 +197,32 @@ class TestProcessFeedConditional:
         )
 
         # Store original content to verify it's unchanged
-        original_content = self.output_path.read_text()
-        original_mtime = self.output_path.stat().st_mtime
+        before = self.output_path.read_bytes()
+        before_mtime = self.output_path.stat().st_mtime
 
         process_feed(config)
 
+        after = self.output_path.read_bytes()
+        after_mtime = self.output_path.stat().st_mtime
+
         # Verify no changes were made
-        assert self.output_path.read_text() == original_content
-        assert self.output_path.stat().st_mtime == original_mtime
-        assert len(responses.calls) == 1
+        assert before == after
+        assert before_mtime == after_mtime
+        assert len(httpserver.log) == 1
 
-    @responses.activate
     @freeze_time("2024-01-02 15:00:00")
-    def test_process_feed_200_with_new_content(self):
+    def test_process_feed_200_with_new_content(self, httpserver):
         """Test successful processing with new content and timestamp update."""
         # Create existing output file
-        self.output_path.write_text("<?xml version='1.0'?><rss><channel></channel></rss>")
+        self.output_path.write_bytes(_EMPTY_FEED)
         file_time = 1704110400.0  # Jan 1, 2024
         os.utime(self.output_path, (file_time, file_time))
 
         last_modified_str = "Tue, 02 Jan 2024 12:00:00 GMT"
         last_modified_timestamp = 1704196800.0
 
-        responses.add(
-            responses.GET,
-            self.url,
-            body=UPDATED_RSS_CONTENT,
+        httpserver.expect_request(FEED_PATH).respond_with_data(
+            UPDATED_RSS_CONTENT,
             headers={"Last-Modified": last_modified_str},
             status=200
         )
@@ -241,12 +237,12 @@ class TestProcessFeedConditional:
 
         # Verify file was updated with new timestamp
         assert self.output_path.stat().st_mtime == last_modified_timestamp
-        assert "Episode 2: Second Episode" in self.output_path.read_text()
+        assert b"Episode 2: Second Episode" in self.output_path.read_bytes()
 
     def test_process_feed_no_check_modified_config(self):
         """Test that check_modified=False disables conditional fetching."""
         # Create existing output file
-        self.output_path.write_text("<?xml version='1.0'?><rss><channel></channel></rss>")
+        self.output_path.write_bytes(_EMPTY_FEED)
 
         config = FeedConfig(
             url=self.url,
@@ -279,7 +275,7 @@ class TestProcessFeedConditional:
     def test_process_feed_cli_no_check_modified_override(self):
         """Test that CLI --no-check-modified overrides config setting."""
         # Create existing output file
-        self.output_path.write_text("<?xml version='1.0'?><rss><channel></channel></rss>")
+        self.output_path.write_bytes(_EMPTY_FEED)
 
         config = FeedConfig(
             url=self.url,
@@ -309,19 +305,16 @@ class TestProcessFeedConditional:
             # Verify feedparser.parse was called directly (not conditional fetch)
             mock_parse.assert_called_with(self.url)
 
-    @responses.activate
-    def test_process_feed_fallback_on_request_error(self):
+    def test_process_feed_fallback_on_request_error(self, httpserver):
         """Test fallback to regular feedparser when conditional fetch fails."""
         # Create existing output file
-        self.output_path.write_text("<?xml version='1.0'?><rss><channel></channel></rss>")
+        self.output_path.write_bytes(_EMPTY_FEED)
         file_time = 1704110400.0
         os.utime(self.output_path, (file_time, file_time))
 
         # Mock request failure for conditional fetch
-        responses.add(
-            responses.GET,
-            self.url,
-            body="Server Error",
+        httpserver.expect_request(FEED_PATH).respond_with_data(
+            "Server Error",
             status=500
         )
 
@@ -347,13 +340,10 @@ class TestProcessFeedConditional:
                 # Verify fallback was used
                 mock_parse.assert_called_with(self.url)
 
-    @responses.activate
-    def test_process_feed_without_existing_file(self):
+    def test_process_feed_without_existing_file(self, httpserver):
         """Test initial fetch when no output file exists."""
-        responses.add(
-            responses.GET,
-            self.url,
-            body=SAMPLE_RSS_CONTENT,
+        httpserver.expect_request(FEED_PATH).respond_with_data(
+            SAMPLE_RSS_CONTENT,
             headers={"Last-Modified": "Mon, 01 Jan 2024 12:00:00 GMT"},
             status=200
         )
@@ -369,13 +359,12 @@ class TestProcessFeedConditional:
         # Verify file was created and timestamped
         assert self.output_path.exists()
         assert self.output_path.stat().st_mtime == 1704110400.0  # Jan 1, 2024 12:00:00 GMT
-        assert "Episode 1: Introduction" in self.output_path.read_text()
+        assert b"Episode 1: Introduction" in self.output_path.read_bytes()
 
         # Verify no If-Modified-Since header was sent (no existing file)
-        assert "If-Modified-Since" not in responses.calls[0].request.headers
+        assert "If-Modified-Since" not in httpserver.log[0][0].headers
 
-    @responses.activate
-    def test_process_feed_timestamp_preserved_when_no_new_episodes(self):
+    def test_process_feed_timestamp_preserved_when_no_new_episodes(self, httpserver):
         """Test that timestamp is preserved when feed updates but no new episodes match filters."""
         # Create existing output file with existing episode
         existing_feed_xml = '''<?xml version="1.0" encoding="UTF-8"?>
@@ -420,10 +409,8 @@ class TestProcessFeedConditional:
   </channel>
 </rss>'''
 
-        responses.add(
-            responses.GET,
-            self.url,
-            body=updated_feed_content,
+        httpserver.expect_request(FEED_PATH).respond_with_data(
+            updated_feed_content,
             headers={"Last-Modified": "Mon, 02 Jan 2024 12:00:00 GMT"},
             status=200
         )
@@ -440,29 +427,27 @@ class TestProcessFeedConditional:
         # File should be updated (rewritten) but timestamp should NOT be set to Last-Modified
         # because no new episodes were actually added to this filtered feed
         assert self.output_path.exists()
+        after_mtime = self.output_path.stat().st_mtime
         # Timestamp should NOT be the Last-Modified time since no new episodes were added
         last_modified_timestamp = 1704196800.0  # Jan 2, 2024 12:00:00 GMT
-        assert self.output_path.stat().st_mtime != last_modified_timestamp
+        assert after_mtime != last_modified_timestamp
         # File was rewritten so timestamp changed from original, but not set to Last-Modified
-        assert self.output_path.stat().st_mtime != original_time
+        assert after_mtime != original_time
 
         # Verify content is still the same (only tech episode)
-        content = self.output_path.read_text()
-        assert "Episode 1: Tech Discussion" in content
-        assert "Episode 2: Sports Talk" not in content  # Filtered out
+        content = self.output_path.read_bytes()
+        assert b"Episode 1: Tech Discussion" in content
+        assert b"Episode 2: Sports Talk" not in content  # Filtered out
 
-    @responses.activate
-    def test_process_feed_conditional_with_filtering(self):
+    def test_process_feed_conditional_with_filtering(self, httpserver):
         """Test that conditional fetching works with content filtering."""
         # Create existing output file
-        self.output_path.write_text("<?xml version='1.0'?><rss><channel></channel></rss>")
+        self.output_path.write_bytes(_EMPTY_FEED)
         file_time = 1704110400.0
         os.utime(self.output_path, (file_time, file_time))
 
-        responses.add(
-            responses.GET,
-            self.url,
-            body=UPDATED_RSS_CONTENT,
+        httpserver.expect_request(FEED_PATH).respond_with_data(
+            UPDATED_RSS_CONTENT,
             headers={"Last-Modified": "Tue, 02 Jan 2024 12:00:00 GMT"},
             status=200
         )
@@ -477,9 +462,238 @@ class TestProcessFeedConditional:
         process_feed(config)
 
         # Verify filtering was applied and file was updated
-        content = self.output_path.read_text()
-        assert "Episode 2: Second Episode" in content
-        assert "Episode 1: Introduction" not in content
+        content = self.output_path.read_bytes()
+        assert b"Episode 2: Second Episode" in content
+        assert b"Episode 1: Introduction" not in content
+
+    def test_process_feed_identical_body_skips_parse(self, httpserver):
+        """Test that a byte-identical 200 body is not parsed a second time."""
+        httpserver.expect_request(FEED_PATH).respond_with_data(
+            SAMPLE_RSS_CONTENT,
+            status=200
+        )
+
+        config = FeedConfig(
+            url=self.url,
+            output=str(self.output_path),
+            check_modified=True
+        )
+
+        with patch('podfeedfilter.filterer.feedparser.parse',
+                   wraps=feedparser.parse) as mock_parse:
+            process_feed(config)
+            before = self.output_path.read_bytes()
+            process_feed(config)
+
+        # Only the first body is parsed; the second run returns early
+        remote_parses = [
+            call for call in mock_parse.call_args_list
+            if call.args[0] == SAMPLE_RSS_CONTENT
+        ]
+        assert len(remote_parses) == 1
+        assert len(httpserver.log) == 2
+        assert self.output_path.read_bytes() == before
+        assert "body_sha256" in _load_meta(self.output_path)
+
+    def test_process_feed_identical_body_after_filter_edit_is_parsed(self, httpserver):
+        """Test that edited filters are applied to an unchanged body."""
+        httpserver.expect_request(FEED_PATH).respond_with_data(
+            UPDATED_RSS_CONTENT,
+            status=200
+        )
+
+        config = FeedConfig(
+            url=self.url,
+            output=str(self.output_path),
+            include=["Second"],
+            check_modified=True
+        )
+        process_feed(config)
+        assert b"Episode 1: Introduction" not in self.output_path.read_bytes()
+        first_meta = _load_meta(self.output_path)
+
+        process_feed(replace(config, include=["Second", "Introduction"]))
+
+        content = self.output_path.read_bytes()
+        assert b"Episode 2: Second Episode" in content
+        assert b"Episode 1: Introduction" in content
+        meta = _load_meta(self.output_path)
+        assert meta["body_sha256"] == first_meta["body_sha256"]
+        assert meta["config_sha256"] != first_meta["config_sha256"]
+
+    def test_config_digest_ignores_keyword_case_and_order(self):
+        """Test only filter edits that can change the output alter the digest."""
+        config = FeedConfig(url=self.url, output=str(self.output_path),
+                            include=["Tech", "News"], exclude=["Ads"])
+
+        assert _config_digest(config) == _config_digest(
+            replace(config, include=["news", "TECH"], exclude=["ads"]))
+        assert _config_digest(config) != _config_digest(
+            replace(config, exclude=["Ads", "Sponsor"]))
+        assert _config_digest(config) != _config_digest(
+            replace(config, title="Renamed"))
+
+    def test_process_feed_changed_body_is_parsed(self, httpserver):
+        """Test that a different body after a stored digest is processed."""
+        httpserver.expect_ordered_request(FEED_PATH).respond_with_data(
+            SAMPLE_RSS_CONTENT,
+            status=200
+        )
+        httpserver.expect_ordered_request(FEED_PATH).respond_with_data(
+            UPDATED_RSS_CONTENT,
+            status=200
+        )
+
+        config = FeedConfig(
+            url=self.url,
+            output=str(self.output_path),
+            check_modified=True
+        )
+
+        process_feed(config)
+        first_digest = _load_meta(self.output_path)["body_sha256"]
+        process_feed(config)
+
+        assert b"Episode 2: Second Episode" in self.output_path.read_bytes()
+        assert _load_meta(self.output_path)["body_sha256"] != first_digest
+
+    @pytest.mark.parametrize(
+        "body",
+        [UPDATED_RSS_CONTENT, PERMALINK_RSS_CONTENT, NAMESPACED_RSS_CONTENT,
+         ITUNES_SUMMARY_RSS_CONTENT],
+        ids=["plain", "permalink", "namespaced", "itunes_summary"],
+    )
+    def test_process_feed_fast_parse_matches_feedparser(self, httpserver, body):
+        """Test the fast_parse path writes the same items as feedparser."""
+        httpserver.expect_request(FEED_PATH).respond_with_data(
+            body,
+            status=200
+        )
+        fast_path = self.temp_dir / "fast.xml"
+
+        for output, fast in ((self.output_path, False), (fast_path, True)):
+            process_feed(FeedConfig(url=self.url, output=str(output),
+                                    fast_parse=fast))
+
+        slow_feed = feedparser.parse(str(self.output_path))
+        fast_feed = feedparser.parse(str(fast_path))
+        assert fast_feed.feed.title == slow_feed.feed.title
+        assert [
+            (e.id, e.title, e.get("link"), e.summary, e.published,
+             e.get("author"), e.get("content"), e.enclosures)
+            for e in fast_feed.entries
+        ] == [
+            (e.id, e.title, e.get("link"), e.summary, e.published,
+             e.get("author"), e.get("content"), e.enclosures)
+            for e in slow_feed.entries
+        ]
+
+    @pytest.mark.parametrize("meta_content", ["not json", "[1, 2]"])
+    def test_load_meta_ignores_unusable_sidecar(self, meta_content):
+        """Test that corrupt or non-object sidecars are treated as empty."""
+        _meta_path(self.output_path).write_text(meta_content)
+
+        assert _load_meta(self.output_path) == {}
+
+
+class TestAdaptivePolling:
+    """Test update-cadence tracking and adaptive poll skipping."""
+
+    def test_record_update_first_observation(self):
+        """Test the first update only records when it was seen."""
+        meta = {}
+        _record_update(meta, 1000.0)
+        assert meta == {"last_update_seen": 1000.0}
+
+    def test_record_update_moving_average(self):
+        """Test later updates fold their interval into the moving average."""
+        meta = {}
+        _record_update(meta, 1000.0)
+        _record_update(meta, 2000.0)
+        assert meta["ewma_interval"] == 1000.0
+
+        _record_update(meta, 5000.0)
+        assert meta["ewma_interval"] == pytest.approx(0.7 * 1000.0 + 0.3 * 3000.0)
+        assert meta["last_update_seen"] == 5000.0
+
+    def test_record_update_ignores_stale_time(self):
+        """Test an update time not after the last one changes nothing."""
+        meta = {"last_update_seen": 2000.0, "ewma_interval": 500.0}
+        _record_update(meta, 1500.0)
+        assert meta == {"last_update_seen": 2000.0, "ewma_interval": 500.0}
+
+    @pytest.mark.parametrize("adaptive,min_interval,now,expected", [
+        (False, 0.0, 1100.0, True),    # Disabled: always poll
+        (True, 0.0, 1100.0, False),    # Inside 500s average window
+        (True, 0.0, 1500.0, True),     # Window elapsed
+        (True, 1000.0, 1500.0, False), # User minimum widens the window
+    ])
+    def test_poll_due(self, adaptive, min_interval, now, expected):
+        """Test the poll window honours the average and user minimum."""
+        config = FeedConfig(url="u", output="o", adaptive_poll=adaptive,
+                            min_poll_interval=min_interval)
+        meta = {"last_update_seen": 1000.0, "ewma_interval": 500.0}
+        assert _poll_due(config, meta, now) is expected
+
+    def test_poll_due_caps_window(self):
+        """Test rarely updated feeds are still polled once the cap passes."""
+        config = FeedConfig(url="u", output="o", adaptive_poll=True)
+        meta = {"last_update_seen": 0.0, "ewma_interval": 10 * _MAX_POLL_INTERVAL}
+        assert _poll_due(config, meta, _MAX_POLL_INTERVAL) is True
+
+    def test_poll_due_without_history(self):
+        """Test feeds with no observed cadence are always polled."""
+        config = FeedConfig(url="u", output="o", adaptive_poll=True)
+        assert _poll_due(config, {"last_update_seen": 1000.0}, 1001.0) is True
+
+    def test_process_feed_skips_fetch_inside_window(self, tmp_path, httpserver):
+        """Test process_feed makes no request while the poll window is open."""
+        output_path = tmp_path / "feed.xml"
+        output_path.write_bytes(_EMPTY_FEED)
+        _save_meta(output_path, {
+            "last_update_seen": time.time(),
+            "ewma_interval": 3600.0,
+        })
+        config = FeedConfig(url=httpserver.url_for(FEED_PATH),
+                            output=str(output_path), adaptive_poll=True)
+
+        process_feed(config)
+
+        assert len(httpserver.log) == 0
+        assert output_path.read_bytes() == _EMPTY_FEED
+
+    def test_process_feed_records_update_time(self, tmp_path, httpserver):
+        """Test processed bodies record the Last-Modified time as an update."""
+        httpserver.expect_request(FEED_PATH).respond_with_data(
+            SAMPLE_RSS_CONTENT,
+            headers={"Last-Modified": "Mon, 01 Jan 2024 12:00:00 GMT"},
+            status=200
+        )
+        output_path = tmp_path / "feed.xml"
+        config = FeedConfig(url=httpserver.url_for(FEED_PATH),
+                            output=str(output_path), adaptive_poll=True)
+
+        process_feed(config)
+
+        assert _load_meta(output_path)["last_update_seen"] == 1704110400.0
+
+    def test_process_feed_with_source_skips_fetch(self, tmp_path, httpserver):
+        """Test a pre-parsed source is used without fetching or polling."""
+        output_path = tmp_path / "feed.xml"
+        output_path.write_bytes(_EMPTY_FEED)
+        meta = {"last_update_seen": time.time(), "ewma_interval": 3600.0}
+        _save_meta(output_path, meta)
+        config = FeedConfig(url=httpserver.url_for(FEED_PATH),
+                            output=str(output_path), adaptive_poll=True)
+
+        source = feedparser.parse(SAMPLE_RSS_CONTENT)
+
+        process_feed(config, source=source)
+
+        assert len(httpserver.log) == 0
+        written = feedparser.parse(output_path.read_bytes())
+        assert [e.id for e in written.entries] == [e.id for e in source.entries]
+        assert _load_meta(output_path) == meta
 
 
 class TestConfigurationLoading:
@@ -5,42 +5,149 @@ FeedConfig object creation from YAML, base output plus splits parsing,
 default value handling, empty configuration scenarios, and error
 conditions with malformed or missing configuration data.
 """
+import dataclasses
+import json
+
 import pytest
 import yaml
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from typing import List
 
+from podfeedfilter import config as config_module
 from podfeedfilter.config import load_config, FeedConfig
 
 
-class TestLoadConfig:
-    """Test class for load_config function."""
+_SPLIT_KEY_COMPAT_YAML = """
+feeds:
+  - url: "https://example.com/feed1.xml"
+    splits:
+      - output: "from_splits.xml"
+        include: ["tech"]
+  - url: "https://example.com/feed2.xml"
+    split:
+      - output: "from_split.xml"
+        include: ["science"]
+"""
 
-    def test_basic_config_with_output_and_splits(self, tmp_path):
-        """Test correct parsing of base output + splits into multiple FeedConfig objects."""
-        config_content = """
+_NONE_VALUES_YAML = """
 feeds:
   - url: "https://example.com/feed.xml"
-    output: "base_output.xml"
-    include: ["python", "programming"]
-    exclude: ["boring"]
-    title: "Base Feed"
-    description: "Base feed description"
+    output: "test.xml"
+    include: null
+    exclude: null
+"""
+
+_EMPTY_FEEDS_YAML = """
+feeds: []
+"""
+
+_MISSING_FEEDS_KEY_YAML = """
+some_other_key: "value"
+"""
+
+_EMPTY_FILE_YAML = ""
+
+_MISSING_URL_YAML = """
+feeds:
+  - output: "test.xml"
+    include: ["python"]
+"""
+
+_INVALID_SYNTAX_YAML = """
+feeds:
+  - url: "https://example.com/feed.xml"
+    include: ["python"
+    # Missing closing bracket
+"""
+
+_MIXED_FEEDS_YAML = """
+feeds:
+  - url: "https://example.com/feed1.xml"
+    output: "feed1.xml"
+    include: ["python"]
+
+  - url: "https://example.com/feed2.xml"
     splits:
-      - output: "split1.xml"
-        include: ["advanced"]
-        exclude: ["beginner"]
-        title: "Advanced Topics"
-        description: "Advanced programming topics"
-      - output: "split2.xml"
-        include: ["beginner"]
-        title: "Beginner Topics"
+      - output: "feed2_split1.xml"
+        include: ["tech"]
+      - output: "feed2_split2.xml"
+        exclude: ["boring"]
+
+  - url: "https://example.com/feed3.xml"
+    output: "feed3.xml"
+    title: "Custom Feed"
+    splits:
+      - output: "feed3_split.xml"
+        title: "Split Feed"
 """
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
 
-        result = load_config(str(config_file))
+# Configs whose content never changes; written once per session
+_STATIC_CONFIGS = {
+    "split_key_compat": _SPLIT_KEY_COMPAT_YAML,
+    "none_values": _NONE_VALUES_YAML,
+    "empty_feeds": _EMPTY_FEEDS_YAML,
+    "missing_feeds_key": _MISSING_FEEDS_KEY_YAML,
+    "empty_file": _EMPTY_FILE_YAML,
+    "missing_url": _MISSING_URL_YAML,
+    "invalid_syntax": _INVALID_SYNTAX_YAML,
+    "mixed_feeds": _MIXED_FEEDS_YAML,
+}
+
+
+@pytest.fixture(scope="session")
+def static_configs(tmp_path_factory):
+    """Write every static config once and return their paths by name."""
+    config_dir = tmp_path_factory.mktemp("configs")
+    paths = {}
+    for name, content in _STATIC_CONFIGS.items():
+        paths[name] = config_dir / f"{name}.yaml"
+        paths[name].write_text(content)
+    return paths
+
+
+@pytest.fixture(scope="session")
+def _config_scratch_file(tmp_path_factory):
+    """Single config path reused by every _load_config_from_string call."""
+    return tmp_path_factory.mktemp("scratch") / "config.yaml"
+
+
+@pytest.fixture
+def _load_config_from_string(_config_scratch_file):
+    """Return a helper that loads FeedConfigs from YAML text.
+
+    The text is rewritten into one session-wide scratch file rather than
+    a fresh file per call; use it for tests that assert on FeedConfig
+    fields rather than on file handling.
+    """
+    def _load(config_content: str) -> List[FeedConfig]:
+        _config_scratch_file.write_text(config_content)
+        return load_config(_config_scratch_file)
+
+    return _load
+
+
+class TestLoadConfig:
+    """Test class for load_config function."""
+
+    def test_basic_config_with_output_and_splits(self, make_feed_yaml):
+        """Test correct parsing of base output + splits into multiple FeedConfig objects."""
+        config_file = make_feed_yaml(
+            "https://example.com/feed.xml",
+            output="base_output.xml",
+            include=["python", "programming"],
+            exclude=["boring"],
+            title="Base Feed",
+            description="Base feed description",
+            splits=[
+                {"output": "split1.xml", "include": ["advanced"],
+                 "exclude": ["beginner"], "title": "Advanced Topics",
+                 "description": "Advanced programming topics"},
+                {"output": "split2.xml", "include": ["beginner"],
+                 "title": "Beginner Topics"},
+            ])
+
+        result = load_config(config_file)
 
         # Should have 3 FeedConfig objects: 1 base + 2 splits
         assert len(result) == 3
@@ -72,21 +179,16 @@ feeds:
         assert split2.title == "Beginner Topics"
         assert split2.description is None  # Default None
 
-    def test_splits_only_no_base_output(self, tmp_path):
+    def test_splits_only_no_base_output(self, make_feed_yaml):
         """Test feed with only splits and no base output."""
-        config_content = """
-feeds:
-  - url: "https://example.com/feed.xml"
-    splits:
-      - output: "split1.xml"
-        include: ["tech"]
-      - output: "split2.xml"
-        include: ["science"]
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
+        config_file = make_feed_yaml(
+            "https://example.com/feed.xml",
+            splits=[
+                {"output": "split1.xml", "include": ["tech"]},
+                {"output": "split2.xml", "include": ["science"]},
+            ])
 
-        result = load_config(str(config_file))
+        result = load_config(config_file)
 
         # Should have only 2 FeedConfig objects from splits
         assert len(result) == 2
@@ -99,39 +201,21 @@ feeds:
         assert result[1].output == "split2.xml"
         assert result[1].include == ["science"]
 
-    def test_split_vs_splits_key_compatibility(self, tmp_path):
+    def test_split_vs_splits_key_compatibility(self, static_configs):
         """Test that both 'split' and 'splits' keys work."""
-        config_content = """
-feeds:
-  - url: "https://example.com/feed1.xml"
-    splits:
-      - output: "from_splits.xml"
-        include: ["tech"]
-  - url: "https://example.com/feed2.xml"
-    split:
-      - output: "from_split.xml"
-        include: ["science"]
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
+        config_file = static_configs["split_key_compat"]
 
-        result = load_config(str(config_file))
+        result = load_config(config_file)
 
         assert len(result) == 2
         assert result[0].output == "from_splits.xml"
         assert result[1].output == "from_split.xml"
 
-    def test_defaults_for_optional_fields(self, tmp_path):
+    def test_defaults_for_optional_fields(self, make_feed_yaml):
         """Test defaults for optional fields."""
-        config_content = """
-feeds:
-  - url: "https://example.com/feed.xml"
-    output: "test.xml"
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
+        config_file = make_feed_yaml("https://example.com/feed.xml", output="test.xml")
 
-        result = load_config(str(config_file))
+        result = load_config(config_file)
 
         assert len(result) == 1
         config = result[0]
@@ -145,35 +229,60 @@ feeds:
         assert config.exclude == []
         assert config.title is None
         assert config.description is None
+        assert config.adaptive_poll is False
+        assert config.min_poll_interval == 0.0
+        assert config.fast_parse is False
+
+    def test_adaptive_poll_inherited_by_splits(self, make_feed_yaml):
+        """Test adaptive polling settings are inherited and overridable by splits."""
+        config_file = make_feed_yaml(
+            "https://example.com/feed.xml",
+            output="base.xml",
+            adaptive_poll=True,
+            min_poll_interval=3600,
+            splits=[
+                {"output": "inherits.xml"},
+                {"output": "overrides.xml", "adaptive_poll": False,
+                 "min_poll_interval": 60},
+            ])
+
+        result = load_config(config_file)
+
+        assert [(c.adaptive_poll, c.min_poll_interval) for c in result] == [
+            (True, 3600.0),
+            (True, 3600.0),
+            (False, 60.0),
+        ]
 
-    def test_default_output_filename(self, tmp_path):
+    def test_fast_parse_inherited_by_splits(self, make_feed_yaml):
+        """Test the fast_parse flag is inherited and overridable by splits."""
+        config_file = make_feed_yaml(
+            "https://example.com/feed.xml",
+            output="base.xml",
+            fast_parse=True,
+            splits=[
+                {"output": "inherits.xml"},
+                {"output": "overrides.xml", "fast_parse": False},
+            ])
+
+        result = load_config(config_file)
+
+        assert [c.fast_parse for c in result] == [True, True, False]
+
+    def test_default_output_filename(self, make_feed_yaml):
         """Test that default output filename is used when not specified."""
-        config_content = """
-feeds:
-  - url: "https://example.com/feed.xml"
-    include: ["python"]
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
+        config_file = make_feed_yaml("https://example.com/feed.xml", include=["python"])
 
-        result = load_config(str(config_file))
+        result = load_config(config_file)
 
         assert len(result) == 1
         assert result[0].output == "filtered.xml"
 
-    def test_none_values_converted_to_empty_lists(self, tmp_path):
+    def test_none_values_converted_to_empty_lists(self, static_configs):
         """Test that None values for include/exclude are converted to empty lists."""
-        config_content = """
-feeds:
-  - url: "https://example.com/feed.xml"
-    output: "test.xml"
-    include: null
-    exclude: null
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
+        config_file = static_configs["none_values"]
 
-        result = load_config(str(config_file))
+        result = load_config(config_file)
 
         assert len(result) == 1
         config = result[0]
@@ -181,101 +290,57 @@ feeds:
         assert config.include == []
         assert config.exclude == []
 
-    def test_empty_feeds_list(self, tmp_path):
+    def test_empty_feeds_list(self, static_configs):
         """Test handling empty feeds: list."""
-        config_content = """
-feeds: []
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
+        config_file = static_configs["empty_feeds"]
 
-        result = load_config(str(config_file))
+        result = load_config(config_file)
 
         assert isinstance(result, list)
         assert not result
 
-    def test_missing_feeds_key(self, tmp_path):
+    def test_missing_feeds_key(self, static_configs):
         """Test handling missing feeds key."""
-        config_content = """
-some_other_key: "value"
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
+        config_file = static_configs["missing_feeds_key"]
 
-        result = load_config(str(config_file))
+        result = load_config(config_file)
 
         assert isinstance(result, list)
         assert not result
 
-    def test_empty_config_file(self, tmp_path):
+    def test_empty_config_file(self, static_configs):
         """Test handling completely empty config file."""
-        config_content = ""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
+        config_file = static_configs["empty_file"]
 
-        result = load_config(str(config_file))
+        result = load_config(config_file)
 
         assert isinstance(result, list)
         assert not result
 
-    def test_missing_url_raises_key_error(self, tmp_path):
+    def test_missing_url_raises_key_error(self, static_configs):
         """Test that missing url raises KeyError."""
-        config_content = """
-feeds:
-  - output: "test.xml"
-    include: ["python"]
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
+        config_file = static_configs["missing_url"]
 
         with pytest.raises(KeyError, match="url"):
-            load_config(str(config_file))
+            load_config(config_file)
 
-    def test_invalid_yaml_raises_yaml_error(self, tmp_path):
+    def test_invalid_yaml_raises_yaml_error(self, static_configs):
         """Test that invalid YAML raises yaml.YAMLError."""
-        config_content = """
-feeds:
-  - url: "https://example.com/feed.xml"
-    include: ["python"
-    # Missing closing bracket
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
+        config_file = static_configs["invalid_syntax"]
 
         with pytest.raises(yaml.YAMLError):
-            load_config(str(config_file))
+            load_config(config_file)
 
     def test_nonexistent_file_raises_file_not_found_error(self):
         """Test that non-existent file raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError):
             load_config("/nonexistent/path/config.yaml")
 
-    def test_multiple_feeds_with_mixed_configurations(self, tmp_path):
+    def test_multiple_feeds_with_mixed_configurations(self, static_configs):
         """Test multiple feeds with various configurations."""
-        config_content = """
-feeds:
-  - url: "https://example.com/feed1.xml"
-    output: "feed1.xml"
-    include: ["python"]
+        config_file = static_configs["mixed_feeds"]
 
-  - url: "https://example.com/feed2.xml"
-    splits:
-      - output: "feed2_split1.xml"
-        include: ["tech"]
-      - output: "feed2_split2.xml"
-        exclude: ["boring"]
-
-  - url: "https://example.com/feed3.xml"
-    output: "feed3.xml"
-    title: "Custom Feed"
-    splits:
-      - output: "feed3_split.xml"
-        title: "Split Feed"
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
-
-        result = load_config(str(config_file))
+        result = load_config(config_file)
 
         # Should have 5 FeedConfig objects: 1 + 0 + 2 + 1 + 1 = 5
         assert len(result) == 5
@@ -292,65 +357,47 @@ feeds:
         for i, config in enumerate(result):
             assert config.url == expected_urls[i]
 
-    def test_feed_with_only_url_no_base_output(self, tmp_path):
+    def test_feed_with_only_url_no_base_output(self, make_feed_yaml):
         """Test feed with only URL and no other configuration doesn't create base output."""
-        config_content = """
-feeds:
-  - url: "https://example.com/feed.xml"
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
+        config_file = make_feed_yaml("https://example.com/feed.xml")
 
-        result = load_config(str(config_file))
+        result = load_config(config_file)
 
         # Should be empty because no output, include, exclude, title, or description
         assert not result
 
-    def test_base_output_created_with_any_optional_field(self, tmp_path):
+    @pytest.mark.parametrize("extra_config", [
+        {"output": "test.xml"},
+        {"include": ["python"]},
+        {"exclude": ["boring"]},
+        {"title": "Test Feed"},
+        {"description": "Test description"},
+    ])
+    def test_base_output_created_with_any_optional_field(self, _load_config_from_string,
+                                                         extra_config):
         """Test that base output is created when any optional field is present."""
-        test_cases = [
-            {"output": "test.xml"},
-            {"include": ["python"]},
-            {"exclude": ["boring"]},
-            {"title": "Test Feed"},
-            {"description": "Test description"}
-        ]
-
-        for i, extra_config in enumerate(test_cases):
-            config_content = f"""
-feeds:
-  - url: "https://example.com/feed{i}.xml"
-"""
-            # Add the extra configuration
-            for key, value in extra_config.items():
-                if isinstance(value, str):
-                    config_content += f'    {key}: "{value}"\n'
-                else:
-                    config_content += f'    {key}: {value}\n'
-
-            config_file = tmp_path / f"config{i}.yaml"
-            config_file.write_text(config_content)
+        lines = ['feeds:', '  - url: "https://example.com/feed.xml"']
+        # Add the extra configuration; JSON values are valid YAML flow scalars
+        for key, value in extra_config.items():
+            lines.append(f'    {key}: {json.dumps(value)}')
+        config_content = "\n".join(lines)
 
-            result = load_config(str(config_file))
+        result = _load_config_from_string(config_content)
 
-            assert len(result) == 1, f"Failed for config with {extra_config}"
-            assert result[0].url == f"https://example.com/feed{i}.xml"
+        assert len(result) == 1, f"Failed for config with {extra_config}"
+        assert result[0].url == "https://example.com/feed.xml"
 
-    def test_dataclass_fields_validation(self, tmp_path):
+    def test_dataclass_fields_validation(self, make_feed_yaml):
         """Test that FeedConfig objects have correct field types."""
-        config_content = """
-feeds:
-  - url: "https://example.com/feed.xml"
-    output: "test.xml"
-    include: ["python", "programming"]
-    exclude: ["boring", "ads"]
-    title: "Test Feed"
-    description: "Test description"
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
+        config_file = make_feed_yaml(
+            "https://example.com/feed.xml",
+            output="test.xml",
+            include=["python", "programming"],
+            exclude=["boring", "ads"],
+            title="Test Feed",
+            description="Test description")
 
-        result = load_config(str(config_file))
+        result = load_config(config_file)
 
         assert len(result) == 1
         config = result[0]
@@ -370,3 +417,43 @@ feeds:
         assert config.exclude == ["boring", "ads"]
         assert config.title == "Test Feed"
         assert config.description == "Test description"
+
+    def test_repeat_loads_reuse_parse_but_return_fresh_copies(
+            self, make_feed_yaml):
+        """Test repeat loads skip YAML parsing yet stay independent."""
+        config_file = make_feed_yaml("https://example.com/feed.xml",
+                                     output="test.xml", include=["python"])
+        config_module._parse_config.cache_clear()
+
+        first = load_config(config_file)
+        first[0].include.append("mutated")
+        second = load_config(config_file)
+
+        assert config_module._parse_config.cache_info().hits == 1
+        assert second[0].include == ["python"]
+
+    def test_feed_config_is_frozen(self):
+        """Test FeedConfig fields cannot be reassigned in place."""
+        config = FeedConfig(url="https://example.com/feed.xml", output="o.xml")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.private = False
+        assert not hasattr(config, "__dict__")
+
+    def test_json_config_parsed_like_yaml(self, make_feed_yaml, tmp_path):
+        """Test that a .json config yields the same feeds as its YAML twin."""
+        yaml_file = make_feed_yaml("https://example.com/feed.xml",
+                                   output="base.xml", include=["python"],
+                                   splits=[{"output": "split.xml",
+                                            "exclude": ["ads"]}])
+        json_file = tmp_path / "config.JSON"
+        json_file.write_text(json.dumps(yaml.safe_load(yaml_file.read_text())))
+
+        assert load_config(json_file) == load_config(yaml_file)
+
+    def test_empty_json_config_returns_no_feeds(self, tmp_path):
+        """Test that a JSON null document yields an empty list like YAML."""
+        json_file = tmp_path / "config.json"
+        json_file.write_text("null")
+
+        assert load_config(json_file) == []
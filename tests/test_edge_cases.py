@@ -10,11 +10,10 @@ This module contains tests for various edge cases and error conditions:
 """
 
 from pathlib import Path
-import time
 from unittest.mock import patch, MagicMock
 import pytest
 import feedparser
-from feedgen.feed import FeedGenerator
+from podfeedfilter import filterer
 from podfeedfilter.filterer import process_feed, _copy_entry, _entry_passes, _text_matches
 from podfeedfilter.config import FeedConfig
 
@@ -107,10 +106,10 @@ class TestMalformedXML:
 
         # File should now contain valid XML
         assert output_path.exists()
-        content = output_path.read_text()
-        assert content.startswith('<?xml version=\'1.0\' encoding=\'UTF-8\'?>')
-        assert '<rss' in content
-        assert '</rss>' in content
+        content = output_path.read_bytes()
+        assert content.startswith(b"<?xml version='1.0' encoding='UTF-8'?>")
+        assert b'<rss' in content
+        assert b'</rss>' in content
 
         # Verify it's parseable
         output_feed = feedparser.parse(str(output_path))
@@ -149,8 +148,8 @@ class TestMalformedXML:
 
         # File should now be valid
         assert output_path.exists()
-        content = output_path.read_text()
-        assert content.endswith('</rss>')
+        content = output_path.read_bytes()
+        assert content.endswith(b'</rss>')
 
         # Verify it's parseable
         output_feed = feedparser.parse(str(output_path))
@@ -186,17 +185,27 @@ class TestMalformedXML:
 
         # File should now contain valid XML
         assert output_path.exists()
-        content = output_path.read_text()
+        content = output_path.read_bytes()
         assert len(content) > 0
-        assert content.startswith('<?xml version=\'1.0\' encoding=\'UTF-8\'?>')
+        assert content.startswith(b"<?xml version='1.0' encoding='UTF-8'?>")
+
+
+def _fresh_run(output_path: Path) -> None:
+    """Reset state between benchmark rounds so each one does the full work."""
+    output_path.unlink(missing_ok=True)
+    filterer._keyword_automaton.cache_clear()
 
 
 class TestPerformanceWithLongLists:
-    """Test performance with very long include/exclude lists."""
+    """Test performance with very long include/exclude lists.
+
+    Timings come from pytest-benchmark rather than a fixed wall-clock
+    budget; compare runs with --benchmark-autosave/--benchmark-compare.
+    """
 
-    # Should complete within 30 seconds
     def test_very_long_include_exclude_lists(self, mock_feedparser_parse,
-                                             test_feed_urls, tmp_path):
+                                             test_feed_urls, tmp_path,
+                                             benchmark):
         """Performance smoke test with very long include/exclude lists."""
         test_url = test_feed_urls['normal_feed']
         output_path = tmp_path / "performance_test.xml"
@@ -215,15 +224,8 @@ class TestPerformanceWithLongLists:
             exclude=exclude_list
         )
 
-        start_time = time.time()
-        process_feed(config)
-        end_time = time.time()
-
-        # Should complete reasonably quickly (under 30 seconds due to timeout)
-        processing_time = end_time - start_time
-        assert processing_time < 30.0, (
-            f"Processing took too long: {processing_time} seconds"
-        )
+        benchmark.pedantic(process_feed, args=(config,),
+                           setup=lambda: _fresh_run(output_path), rounds=3)
 
         # Should still produce correct output
         assert output_path.exists()
@@ -231,29 +233,28 @@ class TestPerformanceWithLongLists:
         assert len(output_feed.entries) == 1
         assert output_feed.entries[0].title == "Latest Tech Trends 2024"
 
+    def test_rejected_entries_never_reach_feedgen(self, mock_feedparser_parse,
+                                                  test_feed_urls, tmp_path):
+        """Only entries that pass filtering are copied into feedgen."""
+        config = FeedConfig(
+            url=test_feed_urls['normal_feed'],
+            output=str(tmp_path / "survivors_only.xml"),
+            include=["tech"],
+        )
+
+        with patch('podfeedfilter.filterer._copy_entry',
+                   wraps=_copy_entry) as copy_spy:
+            process_feed(config)
+
+        assert copy_spy.call_count == 1
+        assert copy_spy.call_args.args[1].title == "Latest Tech Trends 2024"
+
+    @pytest.mark.slow
     @patch('podfeedfilter.filterer.requests.get')
     def test_performance_with_large_feed(self, mock_requests_get, mock_feedparser_parse,
-                                         tmp_path):
+                                         large_feed_data, monkeypatch, tmp_path,
+                                         benchmark):
         """Test performance with a large number of episodes."""
-        # Create a mock feed with many episodes
-        large_feed_data = {
-            'entries': [
-                {
-                    'id': f'episode_{i}',
-                    'title': f'Episode {i}: Tech Talk' if i % 2 == 0 else f'Episode {i}: Sports Content',
-                    'description': f'Description for episode {i}',
-                    'link': f'https://example.com/episode_{i}',
-                    'published': 'Mon, 01 Jan 2024 10:00:00 +0000'
-                }
-                for i in range(1000)  # 1000 episodes
-            ],
-            'feed': {
-                'title': 'Large Test Podcast',
-                'description': 'A large test podcast',
-                'link': 'https://example.com/large-feed'
-            }
-        }
-
         # Mock the HTTP request to avoid network timeout
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -262,50 +263,44 @@ class TestPerformanceWithLongLists:
         mock_response.raise_for_status.return_value = None
         mock_requests_get.return_value = mock_response
 
-        def mock_parse(url_or_content):
-            return feedparser.FeedParserDict(large_feed_data)
+        # Wrap once; process_feed only reads the parsed result
+        large_feed = feedparser.FeedParserDict(large_feed_data)
+        original_parse = feedparser.parse
 
-        import podfeedfilter.filterer
-        original_parse = podfeedfilter.filterer.feedparser.parse
-        podfeedfilter.filterer.feedparser.parse = mock_parse
+        def mock_parse(url_or_content, *args, **kwargs):
+            if url_or_content == 'https://example.com/large-feed':
+                return large_feed
+            # Anything else, such as the output file read back below,
+            # goes to the real parser
+            return original_parse(url_or_content, *args, **kwargs)
 
-        try:
-            output_path = tmp_path / "large_feed_test.xml"
-            config = FeedConfig(
-                url='https://example.com/large-feed',
-                output=str(output_path),
-                include=['tech'],
-                exclude=[],
-                check_modified=False  # Disable conditional fetching to avoid HTTP calls
-            )
+        monkeypatch.setattr('podfeedfilter.filterer.feedparser.parse', mock_parse)
 
-            start_time = time.time()
-            process_feed(config)
-            end_time = time.time()
-
-            processing_time = end_time - start_time
-            assert processing_time < 10.0, (
-                f"Processing large feed took too long: {processing_time} "
-                "seconds"
-            )
+        output_path = tmp_path / "large_feed_test.xml"
+        config = FeedConfig(
+            url='https://example.com/large-feed',
+            output=str(output_path),
+            include=['tech'],
+            exclude=[],
+            check_modified=False  # Disable conditional fetching to avoid HTTP calls
+        )
 
-            # Should produce output with tech episodes
-            assert output_path.exists()
-            output_feed = feedparser.parse(str(output_path))
-            # Should have all episodes since we disabled conditional fetching
-            # but filtered by include=['tech'] - only even episodes have "Tech Talk"
-            tech_episodes = [e for e in output_feed.entries if 'tech' in e.get('title', '').lower()]
-            assert len(tech_episodes) == 500  # Only even episodes have "Tech Talk"
+        benchmark.pedantic(process_feed, args=(config,),
+                           setup=lambda: _fresh_run(output_path), rounds=3)
 
-        finally:
-            # Restore original parse function
-            podfeedfilter.filterer.feedparser.parse = original_parse
+        # Should produce output with tech episodes
+        assert output_path.exists()
+        output_feed = feedparser.parse(str(output_path))
+        # Should have all episodes since we disabled conditional fetching
+        # but filtered by include=['tech'] - only even episodes have "Tech Talk"
+        tech_episodes = [e for e in output_feed.entries if 'tech' in e.get('title', '').lower()]
+        assert len(tech_episodes) == 500  # Only even episodes have "Tech Talk"
 
 
 class TestInvalidEnclosureFields:
     """Test handling of invalid or missing enclosure fields."""
 
-    def test_copy_entry_missing_enclosure_length(self):
+    def test_copy_entry_missing_enclosure_length(self, fg):
         """Test _copy_entry with missing enclosure length."""
         entry = feedparser.FeedParserDict({
             'id': 'test_entry',
@@ -313,12 +308,6 @@ class TestInvalidEnclosureFields:
             'enclosures': [{'href': 'http://example.com/audio.mp3', 'type': 'audio/mpeg'}]  # Missing length
         })
 
-        fg = FeedGenerator()
-        fg.load_extension('podcast')
-        fg.title('Test Feed')
-        fg.link(href='http://example.com')
-        fg.description('Test feed description')
-
         fe = fg.add_entry()
 
         # Should not raise an exception
@@ -334,7 +323,7 @@ class TestInvalidEnclosureFields:
         # But the entry should still be created successfully
         assert b'Test Entry' in rss_str
 
-    def test_copy_entry_missing_enclosure_type(self):
+    def test_copy_entry_missing_enclosure_type(self, fg):
         """Test _copy_entry with missing enclosure type."""
         entry = feedparser.FeedParserDict({
             'id': 'test_entry',
@@ -342,12 +331,6 @@ class TestInvalidEnclosureFields:
             'enclosures': [{'href': 'http://example.com/audio.mp3', 'length': '25000000'}]  # Missing type
         })
 
-        fg = FeedGenerator()
-        fg.load_extension('podcast')
-        fg.title('Test Feed')
-        fg.link(href='http://example.com')
-        fg.description('Test feed description')
-
         fe = fg.add_entry()
 
         # Should not raise an exception
@@ -363,7 +346,7 @@ class TestInvalidEnclosureFields:
         # But the entry should still be created successfully
         assert b'Test Entry' in rss_str
 
-    def test_copy_entry_missing_enclosure_length_and_type(self):
+    def test_copy_entry_missing_enclosure_length_and_type(self, fg):
         """Test _copy_entry with missing enclosure length and type."""
         entry = feedparser.FeedParserDict({
             'id': 'test_entry',
@@ -371,12 +354,6 @@ class TestInvalidEnclosureFields:
             'enclosures': [{'href': 'http://example.com/audio.mp3'}]
         })
 
-        fg = FeedGenerator()
-        fg.load_extension('podcast')
-        fg.title('Test Feed')
-        fg.link(href='http://example.com')
-        fg.description('Test feed description')
-
         fe = fg.add_entry()
 
         # Should not raise an exception
@@ -392,7 +369,7 @@ class TestInvalidEnclosureFields:
         # But the entry should still be created successfully
         assert b'Test Entry' in rss_str
 
-    def test_copy_entry_empty_enclosure_list(self):
+    def test_copy_entry_empty_enclosure_list(self, fg):
         """Test _copy_entry with empty enclosure list."""
         entry = feedparser.FeedParserDict({
             'id': 'test_entry',
@@ -400,12 +377,6 @@ class TestInvalidEnclosureFields:
             'enclosures': []  # Empty list
         })
 
-        fg = FeedGenerator()
-        fg.load_extension('podcast')
-        fg.title('Test Feed')
-        fg.link(href='http://example.com')
-        fg.description('Test feed description')
-
         fe = fg.add_entry()
 
         # Should not raise an exception
@@ -419,7 +390,7 @@ class TestInvalidEnclosureFields:
         rss_str = fg.rss_str(pretty=True)
         assert b'Test Entry' in rss_str
 
-    def test_copy_entry_no_enclosures_field(self):
+    def test_copy_entry_no_enclosures_field(self, fg):
         """Test _copy_entry with no enclosures field at all."""
         entry = feedparser.FeedParserDict({
             'id': 'test_entry',
@@ -427,12 +398,6 @@ class TestInvalidEnclosureFields:
             # No enclosures field
         })
 
-        fg = FeedGenerator()
-        fg.load_extension('podcast')
-        fg.title('Test Feed')
-        fg.link(href='http://example.com')
-        fg.description('Test feed description')
-
         fe = fg.add_entry()
 
         # Should not raise an exception
@@ -446,7 +411,7 @@ class TestInvalidEnclosureFields:
         rss_str = fg.rss_str(pretty=True)
         assert b'Test Entry' in rss_str
 
-    def test_copy_entry_malformed_enclosure_data(self):
+    def test_copy_entry_malformed_enclosure_data(self, fg):
         """Test _copy_entry with malformed enclosure data."""
         entry = feedparser.FeedParserDict({
             'id': 'test_entry',
@@ -460,12 +425,6 @@ class TestInvalidEnclosureFields:
             ]
         })
 
-        fg = FeedGenerator()
-        fg.load_extension('podcast')
-        fg.title('Test Feed')
-        fg.link(href='http://example.com')
-        fg.description('Test feed description')
-
         fe = fg.add_entry()
 
         # Should not raise an exception despite malformed data
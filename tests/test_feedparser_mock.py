@@ -123,3 +123,10 @@ def test_all_test_feed_urls(mock_feedparser_parse, test_feed_urls):
         print(f"  Entries: {len(parsed_feed.entries)}")
         if parsed_feed.entries:
             print(f"  First entry: {parsed_feed.entries[0].title}")
+
+
+def test_mock_feedparser_parse_caches_by_url(mock_feedparser_parse, test_feed_urls):
+    """Repeated parses of a test URL reuse the first parse result."""
+    test_url = test_feed_urls['minimal_feed']
+
+    assert feedparser.parse(test_url) is feedparser.parse(test_url)
@@ -4,36 +4,56 @@ Tests the --private/-p command line argument that overrides
 configuration file settings for all feeds.
 """
 
-import subprocess
-import sys
-from pathlib import Path
-from .conftest import create_mock_rss
+import feedparser
+import pytest
+from podfeedfilter.__main__ import _build_parser, main
+
+
+ITUNES_BLOCK = b'<itunes:block>yes</itunes:block>'
+
+
+@pytest.fixture
+def mock_test_feeds(monkeypatch, parsed_mock_feed):
+    """Serve the parsed mock feed for the http://test/ feed URLs."""
+    original_parse = feedparser.parse
+
+    def mock_parse(url_or_file, *args, **kwargs):
+        if isinstance(url_or_file, str) and url_or_file.startswith('http://test/'):
+            return parsed_mock_feed
+        return original_parse(url_or_file, *args, **kwargs)
+
+    monkeypatch.setattr(feedparser, 'parse', mock_parse)
+
+
+def run_cli(*args):
+    """Run main() in-process with the given command line arguments."""
+    main(list(args))
 
 
 class TestPrivateCLIFlag:
     """Test CLI --private flag functionality."""
 
-    def test_cli_help_shows_private_option(self):
+    def test_cli_help_shows_private_option(self, capsys):
         """Test that --help shows the new --private option."""
-        # Use current working directory to make test portable
-        project_root = Path(__file__).parent.parent
-        result = subprocess.run(
-            [sys.executable, "-m", "podfeedfilter", "--help"],
-            capture_output=True,
-            text=True,
-            cwd=str(project_root),
-            check=False
-        )
-
-        assert result.returncode == 0
-        assert "--private" in result.stdout
-        assert "{true,false}" in result.stdout
-        assert "Override private setting for all feeds" in result.stdout
-
-    def test_cli_private_flag_subprocess(self, tmp_path):
-        """Test --private flag through subprocess call."""
-        # Create test config with mixed private settings
-        config_content = """
+        with pytest.raises(SystemExit) as exc_info:
+            run_cli('--help')
+
+        assert exc_info.value.code == 0
+        out = capsys.readouterr().out
+        assert "--private" in out
+        assert "{true,false}" in out
+        assert "Override private setting for all feeds" in out
+
+    @pytest.mark.parametrize("private_flag,expect_block", [
+        ("true", True),
+        ("false", False),
+    ])
+    def test_cli_private_override(self, tmp_path, monkeypatch, mock_test_feeds,
+                                  private_flag, expect_block):
+        """Test --private overrides every feed's configured setting."""
+        # Mixed private settings, so either override changes one of them
+        config_file = tmp_path / "test_config.yaml"
+        config_file.write_text("""
 feeds:
   - url: "http://test/feed1"
     output: "feed1.xml"
@@ -41,145 +61,27 @@ feeds:
   - url: "http://test/feed2"
     output: "feed2.xml"
     private: false
-"""
-        config_file = tmp_path / "test_config.yaml"
-        config_file.write_text(config_content)
-
-        # Create mock RSS feed
-        mock_rss = create_mock_rss()
-
-        # Create test data directory structure
-        test_data_dir = tmp_path / "data" / "feeds"
-        test_data_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create monkeypatch-compatible feeds
-        (test_data_dir / "normal_feed.xml").write_text(mock_rss)
-        (test_data_dir / "minimal_feed.xml").write_text(mock_rss)
-        (test_data_dir / "empty_feed.xml").write_text("""<?xml version="1.0" encoding="UTF-8"?>
-<rss version="2.0"><channel><title>Empty</title><description>Empty</description></channel></rss>""")
-
-        # Test with --private false (should override all to public)
-        project_root = Path(__file__).parent.parent
-        subprocess.run([
-            sys.executable, "-c",
-            f"""
-import sys
-sys.path.insert(0, '{project_root}')
-sys.path.insert(0, '{project_root / "tests"}')
-
-# Mock feedparser for testing
-import feedparser
-from pathlib import Path
-
-original_parse = feedparser.parse
-
-def mock_parse(url_or_file, *args, **kwargs):
-    test_url_mapping = {{
-        'http://test/feed1': '{test_data_dir / "normal_feed.xml"}',
-        'http://test/feed2': '{test_data_dir / "minimal_feed.xml"}',
-    }}
+""")
+        monkeypatch.chdir(tmp_path)
 
-    if isinstance(url_or_file, str) and url_or_file in test_url_mapping:
-        return original_parse(test_url_mapping[url_or_file], *args, **kwargs)
-    return original_parse(url_or_file, *args, **kwargs)
+        run_cli('-c', str(config_file), '--no-check-modified',
+                '--private', private_flag)
 
-feedparser.parse = mock_parse
+        for name in ("feed1.xml", "feed2.xml"):
+            output_path = tmp_path / name
+            assert output_path.exists(), f"{name} was not written"
+            assert (ITUNES_BLOCK in output_path.read_bytes()) is expect_block
 
-# Import and run main
-from podfeedfilter.__main__ import main
-import sys
-sys.argv = ['podfeedfilter', '-c', '{config_file}', '--private', 'false']
-main()
-"""
-        ],
-        capture_output=True,
-        text=True,
-        cwd=str(tmp_path),
-        check=False
-        )
-
-        # Check that feeds were created and both are public (no iTunes block)
-        feed1_path = tmp_path / "feed1.xml"
-        feed2_path = tmp_path / "feed2.xml"
-
-        if feed1_path.exists():
-            content1 = feed1_path.read_text()
-            assert '<itunes:block>yes</itunes:block>' not in content1
-            print("✓ Feed 1 is public (no iTunes block)")
-
-        if feed2_path.exists():
-            content2 = feed2_path.read_text()
-            assert '<itunes:block>yes</itunes:block>' not in content2
-            print("✓ Feed 2 is public (no iTunes block)")
-
-    def test_cli_private_true_override(self, tmp_path):
-        """Test --private true overrides config to make all feeds private."""
-        # Create test config where one feed is explicitly public
-        config_content = """
-feeds:
-  - url: "http://test/feed1"
-    output: "feed1.xml"
-    private: false  # This should be overridden to true
-"""
-        config_file = tmp_path / "test_config.yaml"
-        config_file.write_text(config_content)
-
-        mock_rss = create_mock_rss()
-
-        # Create the data structure for testing
-        test_data_dir = tmp_path / "data" / "feeds"
-        test_data_dir.mkdir(parents=True, exist_ok=True)
-        (test_data_dir / "normal_feed.xml").write_text(mock_rss)
-
-        project_root = Path(__file__).parent.parent
-        subprocess.run([
-            sys.executable, "-c",
-            f"""
-import sys
-sys.path.insert(0, '{project_root}')
-
-import feedparser
-
-original_parse = feedparser.parse
+    def test_cli_invalid_private_value(self, capsys):
+        """Test that invalid --private values are rejected."""
+        with pytest.raises(SystemExit) as exc_info:
+            run_cli('--private', 'invalid')
 
-def mock_parse(url_or_file, *args, **kwargs):
-    if isinstance(url_or_file, str) and url_or_file == 'http://test/feed1':
-        return original_parse('{test_data_dir / "normal_feed.xml"}', *args, **kwargs)
-    return original_parse(url_or_file, *args, **kwargs)
+        assert exc_info.value.code != 0
+        err = capsys.readouterr().err.lower()
+        assert "invalid choice" in err or "choose from" in err
 
-feedparser.parse = mock_parse
 
-from podfeedfilter.__main__ import main
-sys.argv = ['podfeedfilter', '-c', '{config_file}', '--private', 'true']
-main()
-"""
-        ],
-        capture_output=True,
-        text=True,
-        cwd=str(tmp_path),
-        check=False
-        )
-
-        # Check that feed was created and is private (has iTunes block)
-        feed1_path = tmp_path / "feed1.xml"
-
-        if feed1_path.exists():
-            content1 = feed1_path.read_text()
-            assert '<itunes:block>yes</itunes:block>' in content1
-            print("✓ Feed 1 is private (has iTunes block)")
-
-    def test_cli_invalid_private_value(self):
-        """Test that invalid --private values are rejected."""
-        project_root = Path(__file__).parent.parent
-        result = subprocess.run([
-            sys.executable, "-m", "podfeedfilter",
-            "--private", "invalid"
-        ],
-        capture_output=True,
-        text=True,
-        cwd=str(project_root),
-        check=False
-        )
-
-        assert result.returncode != 0
-        assert "invalid choice" in result.stderr.lower() or "choose from" in result.stderr.lower()
+def test_parser_built_once():
+    """Repeated CLI runs reuse one argument parser."""
+    assert _build_parser() is _build_parser()
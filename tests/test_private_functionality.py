@@ -7,204 +7,117 @@ Tests cover:
 - Integration with splits
 """
 
+import json
 import re
+from dataclasses import replace
+import xml.etree.ElementTree as ET
 
 import feedparser
+import pytest
+import yaml
 
 from podfeedfilter.config import FeedConfig, load_config
-from podfeedfilter.filterer import process_feed
+from podfeedfilter.filterer import _setup_feed_generator, process_feed
 from .conftest import create_mock_rss
 
 
-class TestPrivateConfigParsing:
-    """Test configuration parsing for private field."""
+FEED_URL = "http://example.com/feed.xml"
+ITUNES_BLOCK = b'<itunes:block>yes</itunes:block>'
+# Matches the tag ignoring whitespace and case
+ITUNES_BLOCK_RE = re.compile(
+    rb'<\s*itunes:block\s*>\s*yes\s*</\s*itunes:block\s*>',
+    re.IGNORECASE
+)
 
-    def test_private_defaults_to_true_when_missing(self, tmp_path):
-        """Test that private defaults to True when not specified."""
-        config_content = """
-feeds:
-  - url: "http://example.com/feed.xml"
-    output: "test.xml"
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
 
-        feeds = load_config(str(config_file))
-        assert len(feeds) == 1
-        assert feeds[0].private is True
+@pytest.fixture(params=["yaml", "json"])
+def make_feed_config(request, make_feed_yaml):
+    """make_feed_yaml, also served as an equivalent .json config."""
+    def _make(*args, **kwargs):
+        path = make_feed_yaml(*args, **kwargs)
+        if request.param == "yaml":
+            return path
+        json_path = path.with_suffix(".json")
+        if not json_path.exists():
+            json_path.write_text(json.dumps(yaml.safe_load(path.read_bytes())))
+        return json_path
 
-    def test_private_explicit_true(self, tmp_path):
-        """Test explicit private: true."""
-        config_content = """
-feeds:
-  - url: "http://example.com/feed.xml"
-    output: "test.xml"
-    private: true
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
+    return _make
 
-        feeds = load_config(str(config_file))
+
+class TestPrivateConfigParsing:
+    """Test configuration parsing for private field."""
+
+    def test_private_defaults_to_true_when_missing(self, make_feed_config):
+        """Test that private defaults to True when not specified."""
+        feeds = load_config(make_feed_config(FEED_URL, output="test.xml"))
         assert len(feeds) == 1
         assert feeds[0].private is True
 
-    def test_private_explicit_false(self, tmp_path):
-        """Test explicit private: false."""
-        config_content = """
-feeds:
-  - url: "http://example.com/feed.xml"
-    output: "test.xml"
-    private: false
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
-
-        feeds = load_config(str(config_file))
+    @pytest.mark.parametrize("private", [True, False])
+    def test_private_explicit_value(self, make_feed_config, private):
+        """Test explicit private: true/false."""
+        feeds = load_config(
+            make_feed_config(FEED_URL, output="test.xml", private=private))
         assert len(feeds) == 1
-        assert feeds[0].private is False
+        assert feeds[0].private is private
 
-    def test_private_with_splits_individual_settings(self, tmp_path):
+    def test_private_with_splits_individual_settings(self, make_feed_config):
         """Test private settings for main feed and individual splits."""
-        config_content = """
-feeds:
-  - url: "http://example.com/feed.xml"
-    output: "main.xml"
-    private: true
-    splits:
-      - output: "split1.xml"
-        private: false
-        include: ["tech"]
-      - output: "split2.xml"
-        private: true
-        include: ["news"]
-      - output: "split3.xml"
-        # private defaults to true
-        include: ["misc"]
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
-
-        feeds = load_config(str(config_file))
+        config_file = make_feed_config(FEED_URL, output="main.xml", private=True, splits=[
+            {"output": "split1.xml", "private": False, "include": ["tech"]},
+            {"output": "split2.xml", "private": True, "include": ["news"]},
+            # private defaults to true
+            {"output": "split3.xml", "include": ["misc"]},
+        ])
+
+        feeds = load_config(config_file)
         assert len(feeds) == 4  # 1 main + 3 splits
         assert feeds[0].private is True   # main
         assert feeds[1].private is False  # split1
         assert feeds[2].private is True   # split2
         assert feeds[3].private is True   # split3 (default)
 
-    def test_private_only_configuration_creates_base_output(self, tmp_path):
-        """Test that config with only url and private field creates base output."""
-        config_content = """
-feeds:
-  - url: "http://example.com/feed.xml"
-    private: false
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
-
-        feeds = load_config(str(config_file))
+    @pytest.mark.parametrize("private", [True, False])
+    def test_private_only_configuration_creates_base_output(
+            self, make_feed_config, private):
+        """Test that config with only url and private creates a base output with defaults."""
+        feeds = load_config(make_feed_config(FEED_URL, private=private))
         assert len(feeds) == 1
-        assert feeds[0].url == "http://example.com/feed.xml"
+        assert feeds[0].url == FEED_URL
         assert feeds[0].output == "filtered.xml"  # Default output
-        assert feeds[0].private is False
+        assert feeds[0].private is private
         assert feeds[0].include == []
         assert feeds[0].exclude == []
 
-    def test_private_true_sets_private_attribute(self, tmp_path):
-        """Test that config with private: true sets the private attribute and other defaults remain unchanged."""
-        config_content = """
-feeds:
-  - url: "http://example.com/feed.xml"
-    private: true
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
-
-        feeds = load_config(str(config_file))
-        assert len(feeds) == 1
-        assert feeds[0].url == "http://example.com/feed.xml"
-        assert feeds[0].output == "filtered.xml"  # Default output
-        assert feeds[0].private is True
-        assert feeds[0].include == []
-        assert feeds[0].exclude == []
-
-
 
 class TestPrivateITunesBlockGeneration:
     """Test iTunes block tag generation based on private flag."""
 
-    def _create_mock_feed_file(self, tmp_path):
-        """Helper to create a mock RSS feed file."""
-        mock_rss = create_mock_rss()
-        mock_file = tmp_path / "mock_feed.xml"
-        mock_file.write_text(mock_rss)
-        return str(mock_file)
-
-    def test_private_true_adds_itunes_block(self, tmp_path):
-        """Test that private=True adds iTunes block tag."""
-        mock_feed = self._create_mock_feed_file(tmp_path)
-        output_file = tmp_path / "private_output.xml"
-
+    @pytest.mark.parametrize("private_val,expect_block", [
+        (True, True),
+        (False, False),
+        (None, True),  # private defaults to True in dataclass
+    ])
+    def test_itunes_block_follows_private(self, parsed_mock_feed,
+                                          private_val, expect_block):
+        """Test that the iTunes block tag is written only for private feeds.
+
+        Drives the channel setup directly; the end-to-end process_feed
+        path is covered by TestPrivateWithExistingFeatures.
+        """
         config = FeedConfig(
-            url=mock_feed,
-            output=str(output_file),
-            include=[],
-            exclude=[],
-            private=True
+            url=FEED_URL,
+            output="output.xml",
+            **({} if private_val is None else {"private": private_val})
         )
 
-        process_feed(config)
+        fg = _setup_feed_generator(config, parsed_mock_feed.feed)
 
-        assert output_file.exists()
-        content = output_file.read_text()
-        assert '<itunes:block>yes</itunes:block>' in content
-        assert 'xmlns:itunes' in content  # iTunes namespace present
-
-    def test_private_false_omits_itunes_block(self, tmp_path):
-        """Test that private=False omits iTunes block tag."""
-        mock_feed = self._create_mock_feed_file(tmp_path)
-        output_file = tmp_path / "public_output.xml"
-
-        config = FeedConfig(
-            url=mock_feed,
-            output=str(output_file),
-            include=[],
-            exclude=[],
-            private=False
-        )
-
-        process_feed(config)
-
-        assert output_file.exists()
-        content = output_file.read_text()
-        # Use regex to check for absence of <itunes:block> tag, ignoring whitespace and case
-        itunes_block_pattern = re.compile(
-            r'<\s*itunes:block\s*>\s*yes\s*</\s*itunes:block\s*>',
-            re.IGNORECASE
-        )
-        assert not itunes_block_pattern.search(content)
-        # iTunes namespace should still be present (podcast extension loaded)
-        assert 'xmlns:itunes' in content
-
-    def test_private_default_adds_itunes_block(self, tmp_path):
-        """Test that default private behavior (True) adds iTunes block tag."""
-        mock_feed = self._create_mock_feed_file(tmp_path)
-        output_file = tmp_path / "default_output.xml"
-
-        # Don't specify private explicitly - should default to True
-        config = FeedConfig(
-            url=mock_feed,
-            output=str(output_file),
-            include=[],
-            exclude=[]
-            # private defaults to True in dataclass
-        )
-
-        process_feed(config)
-
-        assert output_file.exists()
-        content = output_file.read_text()
-        assert '<itunes:block>yes</itunes:block>' in content
-        assert 'xmlns:itunes' in content
+        content = fg.rss_str()
+        assert bool(ITUNES_BLOCK_RE.search(content)) is expect_block
+        # iTunes namespace is always present (podcast extension loaded)
+        assert b'xmlns:itunes' in content
 
 
 class TestPrivateCLIOverride:
@@ -238,89 +151,85 @@ feeds:
 
         # Simulate CLI override --private false
         private_override = False
-        for feed in feeds:
-            feed.private = private_override
+        feeds = [replace(feed, private=private_override) for feed in feeds]
 
         # After override
         assert feeds[0].private is False
         assert feeds[1].private is False
         assert feeds[2].private is False
 
-    def test_cli_override_forces_private_true(self, tmp_path):
+    def test_cli_override_forces_private_true(self):
         """Test CLI --private true overrides config settings."""
-        config_content = """
-feeds:
-  - url: "http://example.com/feed1.xml"
-    output: "feed1.xml"
-    private: false
-  - url: "http://example.com/feed2.xml"
-    output: "feed2.xml"
-    private: true
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
-
-        feeds = load_config(str(config_file))
-
-        # Before override
-        assert feeds[0].private is False
-        assert feeds[1].private is True
+        feeds = [
+            FeedConfig(url="http://example.com/feed1.xml", output="feed1.xml",
+                       private=False),
+            FeedConfig(url="http://example.com/feed2.xml", output="feed2.xml",
+                       private=True),
+        ]
 
         # Simulate CLI override --private true
         private_override = True
-        for feed in feeds:
-            feed.private = private_override
+        feeds = [replace(feed, private=private_override) for feed in feeds]
 
         # After override
         assert feeds[0].private is True
         assert feeds[1].private is True
 
 
+@pytest.fixture(scope="module")
+def filtering_feed():
+    """Parsed mock feed with one tech and one politics episode."""
+    episodes = [
+        {'title': 'Tech Episode', 'description': 'Programming and technology', 'link': 'http://example.com/tech', 'guid': 'tech'},
+        {'title': 'Politics Episode', 'description': 'Political discussions', 'link': 'http://example.com/politics', 'guid': 'politics'}
+    ]
+    return feedparser.parse(create_mock_rss(episodes=episodes).encode("utf-8"))
+
+
+@pytest.fixture(scope="module")
+def original_metadata_feed():
+    """Parsed mock feed whose title/description a config can override."""
+    episodes = [{'title': 'Test Episode', 'description': 'Test description', 'link': 'http://example.com/episode', 'guid': 'episode'}]
+    return feedparser.parse(create_mock_rss(
+        title="Original Title", description="Original Description",
+        episodes=episodes).encode("utf-8"))
+
+
 class TestPrivateWithExistingFeatures:
     """Test private functionality integration with existing features."""
 
-    def test_private_with_filtering(self, tmp_path):
+    def test_private_with_filtering(self, tmp_path, filtering_feed):
         """Test that private flag works with include/exclude filtering."""
-        episodes = [
-            {'title': 'Tech Episode', 'description': 'Programming and technology', 'link': 'http://example.com/tech', 'guid': 'tech'},
-            {'title': 'Politics Episode', 'description': 'Political discussions', 'link': 'http://example.com/politics', 'guid': 'politics'}
-        ]
-        mock_rss = create_mock_rss(episodes=episodes)
-        mock_file = tmp_path / "mock_feed.xml"
-        mock_file.write_text(mock_rss)
         output_file = tmp_path / "filtered_private.xml"
 
         config = FeedConfig(
-            url=str(mock_file),
+            url=FEED_URL,
             output=str(output_file),
             include=["tech"],  # Only include tech episodes
             exclude=[],
             private=True
         )
 
-        process_feed(config)
+        process_feed(config, source=filtering_feed)
 
         assert output_file.exists()
-        content = output_file.read_text()
+        content = output_file.read_bytes()
 
         # Should have iTunes block (private)
-        assert '<itunes:block>yes</itunes:block>' in content
+        assert ITUNES_BLOCK in content
 
         # Should have filtered content (only tech episode)
-        feed = feedparser.parse(str(output_file))
-        assert len(feed.entries) == 1
-        assert "tech" in feed.entries[0].title.lower()
+        items = ET.fromstring(content).findall("./channel/item")
+        assert len(items) == 1
+        assert "tech" in items[0].findtext("title", "").lower()
 
-    def test_private_with_title_description_override(self, tmp_path):
+    def test_private_with_title_description_override(self, tmp_path,
+                                                     original_metadata_feed):
         """Test private flag with custom title/description."""
-        episodes = [{'title': 'Test Episode', 'description': 'Test description', 'link': 'http://example.com/episode', 'guid': 'episode'}]
-        mock_rss = create_mock_rss(title="Original Title", description="Original Description", episodes=episodes)
-        mock_file = tmp_path / "mock_feed.xml"
-        mock_file.write_text(mock_rss)
         output_file = tmp_path / "custom_private.xml"
 
         config = FeedConfig(
-            url=str(mock_file),
+            url=FEED_URL,
             output=str(output_file),
             include=[],
             exclude=[],
@@ -329,13 +238,13 @@ class TestPrivateWithExistingFeatures:
             private=True
         )
 
-        process_feed(config)
+        process_feed(config, source=original_metadata_feed)
 
         assert output_file.exists()
-        content = output_file.read_text()
+        content = output_file.read_bytes()
 
         # Should have iTunes block
-        assert '<itunes:block>yes</itunes:block>' in content
+        assert ITUNES_BLOCK in content
 
         # Should have custom metadata
         feed = feedparser.parse(str(output_file))
@@ -4,140 +4,63 @@ Tests that the config parser properly handles and validates private field values
 that are not valid boolean types or representations.
 """
 
+import pytest
+import yaml
 
 from podfeedfilter.config import load_config
 
 
-class TestPrivateMalformedValues:
-    """Test malformed private value validation."""
-
-    def test_private_empty_string_converts_to_false(self, tmp_path):
-        """Test that private: "" converts to False (falsy value)."""
-        config_content = """
-feeds:
-  - url: "http://example.com/feed.xml"
-    output: "test.xml"
-    private: ""
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
-
-        feeds = load_config(str(config_file))
-        assert len(feeds) == 1
-        assert feeds[0].private is False  # Empty string is falsy, bool("") == False
+# (private value, expected FeedConfig.private)
+MALFORMED_PRIVATE_CASES = [
+    ("", False),           # bool("") == False
+    (0, False),            # bool(0) == False
+    ([], False),           # bool([]) == False
+    ("notabool", True),    # bool("notabool") == True
+    (42, True),            # bool(42) == True
+    ([1, 2, 3], True),     # bool([1, 2, 3]) == True
+    (None, False),         # bool(None) == False
+]
 
-    def test_private_zero_converts_to_false(self, tmp_path):
-        """Test that private: 0 converts to False."""
-        config_content = """
-feeds:
-  - url: "http://example.com/feed.xml"
-    output: "test.xml"
-    private: 0
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
 
-        feeds = load_config(str(config_file))
-        assert len(feeds) == 1
-        assert feeds[0].private is False  # 0 is falsy, bool(0) == False
-
-    def test_private_empty_list_converts_to_false(self, tmp_path):
-        """Test that private: [] converts to False."""
-        config_content = """
-feeds:
-  - url: "http://example.com/feed.xml"
-    output: "test.xml"
-    private: []
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
-
-        feeds = load_config(str(config_file))
-        assert len(feeds) == 1
-        assert feeds[0].private is False  # Empty list is falsy, bool([]) == False
-
-    def test_private_non_empty_string_converts_to_true(self, tmp_path):
-        """Test that private: "notabool" converts to True (truthy value)."""
-        config_content = """
-feeds:
-  - url: "http://example.com/feed.xml"
-    output: "test.xml"
-    private: "notabool"
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
+@pytest.fixture(scope="module")
+def malformed_private_feeds(tmp_path_factory):
+    """Load one config holding a feed per malformed case, parsed once."""
+    config_file = tmp_path_factory.mktemp("malformed") / "config.yaml"
+    config_file.write_text(yaml.safe_dump({"feeds": [
+        {"url": f"http://example.com/feed{i}.xml", "output": f"test{i}.xml",
+         "private": value}
+        for i, (value, _) in enumerate(MALFORMED_PRIVATE_CASES)
+    ]}))
+    return load_config(config_file)
 
-        feeds = load_config(str(config_file))
-        assert len(feeds) == 1
-        assert feeds[0].private is True  # Non-empty string is truthy, bool("notabool") == True
 
-    def test_private_non_zero_number_converts_to_true(self, tmp_path):
-        """Test that private: 42 converts to True."""
-        config_content = """
-feeds:
-  - url: "http://example.com/feed.xml"
-    output: "test.xml"
-    private: 42
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
-
-        feeds = load_config(str(config_file))
-        assert len(feeds) == 1
-        assert feeds[0].private is True  # Non-zero number is truthy, bool(42) == True
-
-    def test_private_non_empty_list_converts_to_true(self, tmp_path):
-        """Test that private: [1, 2, 3] converts to True."""
-        config_content = """
-feeds:
-  - url: "http://example.com/feed.xml"
-    output: "test.xml"
-    private: [1, 2, 3]
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
-
-        feeds = load_config(str(config_file))
-        assert len(feeds) == 1
-        assert feeds[0].private is True  # Non-empty list is truthy, bool([1, 2, 3]) == True
+class TestPrivateMalformedValues:
+    """Test malformed private value validation."""
 
-    def test_private_null_converts_to_false(self, tmp_path):
-        """Test that private: null converts to False."""
-        config_content = """
-feeds:
-  - url: "http://example.com/feed.xml"
-    output: "test.xml"
-    private: null
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
+    def test_one_feed_per_malformed_case(self, malformed_private_feeds):
+        """Test that every malformed value still yields its feed."""
+        assert len(malformed_private_feeds) == len(MALFORMED_PRIVATE_CASES)
 
-        feeds = load_config(str(config_file))
-        assert len(feeds) == 1
-        assert feeds[0].private is False  # None/null is falsy, bool(None) == False
+    @pytest.mark.parametrize("index,value,expected", [
+        (i, value, expected)
+        for i, (value, expected) in enumerate(MALFORMED_PRIVATE_CASES)
+    ])
+    def test_private_malformed_value_uses_truthiness(
+            self, malformed_private_feeds, index, value, expected):
+        """Test that a non-boolean private value converts by truthiness."""
+        assert malformed_private_feeds[index].private is expected, value
 
-    def test_private_splits_malformed_values(self, tmp_path):
+    def test_private_splits_malformed_values(self, make_feed_yaml):
         """Test that splits also handle malformed private values correctly."""
-        config_content = """
-feeds:
-  - url: "http://example.com/feed.xml"
-    output: "main.xml"
-    private: true
-    splits:
-      - output: "split1.xml"
-        private: ""  # Empty string -> False
-        include: ["tech"]
-      - output: "split2.xml"
-        private: "yes"  # Non-empty string -> True
-        include: ["news"]
-      - output: "split3.xml"
-        private: 0  # Zero -> False
-        include: ["misc"]
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
-
-        feeds = load_config(str(config_file))
+        config_file = make_feed_yaml(
+            "http://example.com/feed.xml", output="main.xml", private=True,
+            splits=[
+                {"output": "split1.xml", "private": "", "include": ["tech"]},
+                {"output": "split2.xml", "private": "yes", "include": ["news"]},
+                {"output": "split3.xml", "private": 0, "include": ["misc"]},
+            ])
+
+        feeds = load_config(config_file)
         assert len(feeds) == 4  # 1 main + 3 splits
         assert feeds[0].private is True   # main: explicit true
         assert feeds[1].private is False  # split1: empty string
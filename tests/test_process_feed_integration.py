@@ -8,10 +8,26 @@ These tests use tmp_path for outputs and monkeypatched feeds to test:
 """
 
 from pathlib import Path
+from unittest.mock import patch
+import xml.etree.ElementTree as ET
+
 import pytest
 import feedparser
-from podfeedfilter.filterer import process_feed
+import requests
+from podfeedfilter import filterer
+from podfeedfilter.filterer import process_feed, process_feeds_batch
 from podfeedfilter.config import FeedConfig
+from .conftest import read_rss
+
+
+XML_DECLARATION = b"<?xml version='1.0' encoding='UTF-8'?>"
+
+
+def assert_rss_document(path: Path) -> None:
+    """Assert path holds a well-formed <rss> document with a declaration."""
+    with path.open('rb') as f:
+        assert f.read(len(XML_DECLARATION)) == XML_DECLARATION
+    assert ET.parse(path).getroot().tag == 'rss'
 
 
 def test_process_feed_creates_output_file(mock_feedparser_parse, test_feed_urls, tmp_path):
@@ -36,138 +52,87 @@ def test_process_feed_creates_output_file(mock_feedparser_parse, test_feed_urls,
     assert output_path.exists()
     assert output_path.is_file()
 
-    # File should contain valid XML
-    content = output_path.read_text()
-    assert content.startswith('<?xml version=\'1.0\' encoding=\'UTF-8\'?>')
-    assert '<rss' in content
-    assert '</rss>' in content
-
-
-def test_process_feed_channel_metadata_overrides(mock_feedparser_parse, test_feed_urls, tmp_path):
-    """Test that RSS channel metadata matches overridden title/description."""
-    test_url = test_feed_urls['normal_feed']
-    output_path = tmp_path / "override_metadata.xml"
-
-    # Custom title and description
-    custom_title = "My Custom Podcast Title"
-    custom_description = "This is my custom podcast description"
-
-    config = FeedConfig(
-        url=test_url,
-        output=str(output_path),
-        include=[],
-        exclude=[],
-        title=custom_title,
-        description=custom_description
-    )
-
-    process_feed(config)
-
-    # Parse the output feed to check metadata
-    output_feed = feedparser.parse(str(output_path))
-
-    # Verify overridden metadata
-    assert output_feed.feed.title == custom_title
-    assert output_feed.feed.description == custom_description
-
-
-def test_process_feed_uses_original_metadata_when_not_overridden(mock_feedparser_parse, test_feed_urls, tmp_path):
-    """Test that original RSS metadata is preserved when not overridden."""
-    test_url = test_feed_urls['normal_feed']
-    output_path = tmp_path / "original_metadata.xml"
-
-    config = FeedConfig(
-        url=test_url,
-        output=str(output_path),
-        include=[],
-        exclude=[],
-        title=None,  # No override
-        description=None  # No override
-    )
-
-    process_feed(config)
-
-    # Parse the output feed to check metadata
-    output_feed = feedparser.parse(str(output_path))
-
-    # Verify original metadata is preserved
-    assert output_feed.feed.title == "Test Podcast"
-    assert output_feed.feed.description == "A test podcast with various episode types"
-
-
-def test_process_feed_include_filtering(mock_feedparser_parse, test_feed_urls, tmp_path):
-    """Test that only episodes meeting include rules appear."""
-    test_url = test_feed_urls['normal_feed']
-    output_path = tmp_path / "include_filtered.xml"
-
+    # File should be a well-formed RSS document with an XML declaration
+    assert_rss_document(output_path)
+
+
+TECH = "Latest Tech Trends 2024"
+ELECTION = "Election Analysis: What Voters Really Want"
+
+# (feed, include, exclude, expected entry titles); None means the
+# output file must not be written
+FILTER_CASES = (
+    pytest.param('normal_feed', ['tech'], [], {TECH}, id='include'),
+    pytest.param('normal_feed', [], ['sponsored'], {TECH, ELECTION},
+                 id='exclude'),
+    # Election episode matches an include but is excluded by "political"
+    pytest.param('normal_feed', ['tech', 'election'], ['political'], {TECH},
+                 id='combined-include-exclude'),
+    pytest.param('normal_feed', ['TECH'], [], {TECH}, id='case-insensitive'),
+    # "technology" only occurs inside the tech episode's description
+    pytest.param('normal_feed', ['technology'], [], {TECH},
+                 id='partial-keyword'),
+    pytest.param('normal_feed', ['nonexistent_keyword'], [], None,
+                 id='no-matches'),
+    pytest.param('empty_feed', [], [], None, id='empty-source'),
+)
+
+
+@pytest.mark.parametrize("feed_key,include,exclude,expected_titles",
+                         FILTER_CASES)
+def test_process_feed_filtering(mock_feedparser_parse, test_feed_urls, tmp_path,
+                                feed_key, include, exclude, expected_titles):
+    """Test that exactly the episodes passing include/exclude rules appear."""
+    output_path = tmp_path / "filtered.xml"
     config = FeedConfig(
-        url=test_url,
+        url=test_feed_urls[feed_key],
         output=str(output_path),
-        include=['tech'],  # Should only include episodes containing 'tech'
-        exclude=[]
+        include=include,
+        exclude=exclude
     )
 
     process_feed(config)
 
-    # Parse the output feed
-    output_feed = feedparser.parse(str(output_path))
-
-    # Check that only episodes with 'tech' in title/description appear
-    assert len(output_feed.entries) == 1
-    assert output_feed.entries[0].title == "Latest Tech Trends 2024"
-
-    # Verify the episode contains the keyword
-    content = f"{output_feed.entries[0].title} {output_feed.entries[0].description}"
-    assert 'tech' in content.lower()
-
-
-def test_process_feed_exclude_filtering(mock_feedparser_parse, test_feed_urls, tmp_path):
-    """Test that episodes matching exclude rules are filtered out."""
-    test_url = test_feed_urls['normal_feed']
-    output_path = tmp_path / "exclude_filtered.xml"
-
+    if expected_titles is None:
+        assert not output_path.exists()
+        return
+    output_feed = read_rss(output_path)
+    assert len(output_feed.entries) == len(expected_titles)
+    assert {entry.title for entry in output_feed.entries} == expected_titles
+
+
+# (feed, configured title/description, expected title/description)
+METADATA_CASES = (
+    pytest.param('normal_feed',
+                 "My Custom Podcast Title", "This is my custom podcast description",
+                 "My Custom Podcast Title", "This is my custom podcast description",
+                 id='overridden'),
+    pytest.param('normal_feed', None, None,
+                 "Test Podcast", "A test podcast with various episode types",
+                 id='original'),
+)
+
+
+@pytest.mark.parametrize(
+    "feed_key,title,description,expected_title,expected_description",
+    METADATA_CASES)
+def test_process_feed_channel_metadata(mock_feedparser_parse, test_feed_urls,
+                                       tmp_path, feed_key, title, description,
+                                       expected_title, expected_description):
+    """Test channel title/description overrides, or the source's when unset."""
+    output_path = tmp_path / "metadata.xml"
     config = FeedConfig(
-        url=test_url,
+        url=test_feed_urls[feed_key],
         output=str(output_path),
-        include=[],
-        exclude=['sponsored']  # Should exclude sponsored episodes only
+        title=title,
+        description=description
     )
 
     process_feed(config)
 
-    # Parse the output feed
-    output_feed = feedparser.parse(str(output_path))
-
-    # Should have 2 episodes (tech and election episodes, excluding sponsored)
-    assert len(output_feed.entries) == 2
-
-    # Verify excluded episodes are not present
-    titles = [entry.title for entry in output_feed.entries]
-    assert "Latest Tech Trends 2024" in titles
-    assert "Election Analysis: What Voters Really Want" in titles
-    assert "Special Offer: Premium Tools for Creators" not in titles
-
-
-def test_process_feed_combined_include_exclude_filtering(mock_feedparser_parse, test_feed_urls, tmp_path):
-    """Test combined include and exclude filtering."""
-    test_url = test_feed_urls['normal_feed']
-    output_path = tmp_path / "combined_filtered.xml"
-
-    config = FeedConfig(
-        url=test_url,
-        output=str(output_path),
-        include=['tech', 'election'],  # Include tech or election episodes
-        exclude=['political']  # But exclude political episodes
-    )
-
-    process_feed(config)
-
-    # Parse the output feed
-    output_feed = feedparser.parse(str(output_path))
-
-    # Should have 1 episode (tech episode, election episode excluded by political)
-    assert len(output_feed.entries) == 1
-    assert output_feed.entries[0].title == "Latest Tech Trends 2024"
+    output_feed = read_rss(output_path)
+    assert output_feed.feed.title == expected_title
+    assert output_feed.feed.description == expected_description
 
 
 def test_process_feed_order_preservation(mock_feedparser_parse, test_feed_urls, tmp_path):
@@ -184,19 +149,15 @@ def test_process_feed_order_preservation(mock_feedparser_parse, test_feed_urls,
 
     process_feed(config)
 
-    # Parse both original and output feeds
-    original_feed = feedparser.parse(test_url)
-    output_feed = feedparser.parse(str(output_path))
-
-    # Should have same number of entries
-    assert len(output_feed.entries) == len(original_feed.entries)
+    output_feed = read_rss(output_path)
 
     # The current implementation adds existing entries first, then new entries
     # Since there are no existing entries, it adds them in reverse order
     # (feedgen adds entries in reverse order)
     output_titles = [entry.title for entry in output_feed.entries]
 
-    # Verify the actual order (feedgen reverses the order)
+    # Verify the actual order (feedgen reverses the order); all three
+    # source episodes are expected
     expected_order = [
         "Special Offer: Premium Tools for Creators",    # 2023-12-30 (last added)
         "Election Analysis: What Voters Really Want",  # 2023-12-31
@@ -205,24 +166,6 @@ def test_process_feed_order_preservation(mock_feedparser_parse, test_feed_urls,
     assert output_titles == expected_order
 
 
-def test_process_feed_no_matching_episodes(mock_feedparser_parse, test_feed_urls, tmp_path):
-    """Test behavior when no episodes match the filtering criteria."""
-    test_url = test_feed_urls['normal_feed']
-    output_path = tmp_path / "no_matches.xml"
-
-    config = FeedConfig(
-        url=test_url,
-        output=str(output_path),
-        include=['nonexistent_keyword'],  # No episodes should match this
-        exclude=[]
-    )
-
-    process_feed(config)
-
-    # Output file should not be created when no episodes match
-    assert not output_path.exists()
-
-
 def test_process_feed_malformed_existing_output(mock_feedparser_parse, test_feed_urls, tmp_path):
     """Test behavior with a pre-existing malformed XML output file."""
     test_url = test_feed_urls['normal_feed']
@@ -243,26 +186,7 @@ def test_process_feed_malformed_existing_output(mock_feedparser_parse, test_feed
 
     # Parse the corrected output
     assert output_path.exists()
-    content = output_path.read_text()
-    assert content.startswith('<?xml version=\'1.0\' encoding=\'UTF-8\'?>')
-
-
-def test_process_feed_empty_source_feed(mock_feedparser_parse, test_feed_urls, tmp_path):
-    """Test behavior with an empty source feed."""
-    test_url = test_feed_urls['empty_feed']
-    output_path = tmp_path / "empty_source.xml"
-
-    config = FeedConfig(
-        url=test_url,
-        output=str(output_path),
-        include=[],
-        exclude=[]
-    )
-
-    process_feed(config)
-
-    # Output file should not be created for empty feeds
-    assert not output_path.exists()
+    assert_rss_document(output_path)
 
 
 def test_process_feed_with_existing_output_file(mock_feedparser_parse, test_feed_urls, tmp_path):
@@ -281,7 +205,7 @@ def test_process_feed_with_existing_output_file(mock_feedparser_parse, test_feed
     process_feed(config1)
 
     # Verify initial output
-    initial_feed = feedparser.parse(str(output_path))
+    initial_feed = read_rss(output_path)
     assert len(initial_feed.entries) == 1
     assert initial_feed.entries[0].title == "Latest Tech Trends 2024"
 
@@ -296,13 +220,11 @@ def test_process_feed_with_existing_output_file(mock_feedparser_parse, test_feed
     process_feed(config2)
 
     # Parse the updated output
-    updated_feed = feedparser.parse(str(output_path))
+    updated_feed = read_rss(output_path)
 
     # Should have both episodes (existing tech + new election)
     assert len(updated_feed.entries) == 2
-    titles = [entry.title for entry in updated_feed.entries]
-    assert "Latest Tech Trends 2024" in titles
-    assert "Election Analysis: What Voters Really Want" in titles
+    assert {entry.title for entry in updated_feed.entries} == {TECH, ELECTION}
 
 
 def test_process_feed_creates_output_directory(mock_feedparser_parse, test_feed_urls, tmp_path):
@@ -343,70 +265,24 @@ def test_process_feed_episode_details_preservation(mock_feedparser_parse, test_f
 
     process_feed(config)
 
-    # Parse the output feed
-    output_feed = feedparser.parse(str(output_path))
-
-    # Get the tech episode
-    tech_episode = output_feed.entries[0]
+    # Read the raw item; values are compared exactly as written
+    tech_episode = ET.parse(output_path).getroot().find('./channel/item')
 
     # Verify episode details are preserved
-    assert tech_episode.title == "Latest Tech Trends 2024"
-    assert tech_episode.link == "https://example.com/podcast/tech-trends-2024"
-    assert tech_episode.description == "Discussion about the latest technology trends shaping 2024"
-    assert tech_episode.id == "tech-trends-2024"
-    assert tech_episode.published == "Mon, 01 Jan 2024 10:00:00 +0000"
+    assert tech_episode.findtext('title') == "Latest Tech Trends 2024"
+    assert tech_episode.findtext('link') == "https://example.com/podcast/tech-trends-2024"
+    assert tech_episode.findtext('description') == "Discussion about the latest technology trends shaping 2024"
+    assert tech_episode.findtext('guid') == "tech-trends-2024"
+    assert tech_episode.findtext('pubDate') == "Mon, 01 Jan 2024 10:00:00 +0000"
     # Note: author field is not preserved in the current implementation
 
     # Verify enclosure (audio file)
-    assert len(tech_episode.enclosures) == 1
-    enclosure = tech_episode.enclosures[0]
-    assert enclosure.href == "https://example.com/audio/tech-trends-2024.mp3"
-    assert enclosure.type == "audio/mpeg"
-    assert enclosure.length == "25000000"
-
-
-def test_process_feed_case_insensitive_filtering(mock_feedparser_parse, test_feed_urls, tmp_path):
-    """Test that filtering is case insensitive."""
-    test_url = test_feed_urls['normal_feed']
-    output_path = tmp_path / "case_insensitive.xml"
-
-    config = FeedConfig(
-        url=test_url,
-        output=str(output_path),
-        include=['TECH'],  # Uppercase keyword
-        exclude=[]
-    )
-
-    process_feed(config)
-
-    # Parse the output feed
-    output_feed = feedparser.parse(str(output_path))
-
-    # Should match the tech episode despite case difference
-    assert len(output_feed.entries) == 1
-    assert output_feed.entries[0].title == "Latest Tech Trends 2024"
-
-
-def test_process_feed_partial_keyword_matching(mock_feedparser_parse, test_feed_urls, tmp_path):
-    """Test that partial keyword matching works correctly."""
-    test_url = test_feed_urls['normal_feed']
-    output_path = tmp_path / "partial_matching.xml"
-
-    config = FeedConfig(
-        url=test_url,
-        output=str(output_path),
-        include=['technology'],  # Partial match for "technology" in tech episode
-        exclude=[]
-    )
-
-    process_feed(config)
-
-    # Parse the output feed
-    output_feed = feedparser.parse(str(output_path))
-
-    # Should match the tech episode via partial keyword matching
-    assert len(output_feed.entries) == 1
-    assert output_feed.entries[0].title == "Latest Tech Trends 2024"
+    enclosures = tech_episode.findall('enclosure')
+    assert len(enclosures) == 1
+    enclosure = enclosures[0]
+    assert enclosure.get('url') == "https://example.com/audio/tech-trends-2024.mp3"
+    assert enclosure.get('type') == "audio/mpeg"
+    assert enclosure.get('length') == "25000000"
 
 
 def test_process_feed_with_minimal_feed(mock_feedparser_parse, test_feed_urls, tmp_path):
@@ -426,7 +302,7 @@ def test_process_feed_with_minimal_feed(mock_feedparser_parse, test_feed_urls, t
     process_feed(config)
 
     # Parse the output feed
-    output_feed = feedparser.parse(str(output_path))
+    output_feed = read_rss(output_path)
 
     # Verify custom metadata
     assert output_feed.feed.title == "Minimal Custom Title"
@@ -434,6 +310,73 @@ def test_process_feed_with_minimal_feed(mock_feedparser_parse, test_feed_urls, t
 
     # Should have the episodes from minimal feed
     assert len(output_feed.entries) == 2
-    titles = [entry.title for entry in output_feed.entries]
-    assert "Episode One" in titles
-    assert "Episode Two" in titles
+    assert ({entry.title for entry in output_feed.entries}
+            == {"Episode One", "Episode Two"})
+
+
+def test_process_feeds_batch_parses_each_url_once(mock_feedparser_parse, test_feed_urls,
+                                                  tmp_path, monkeypatch):
+    """Test that configs sharing a source URL share one parse of it."""
+    parsed_urls = []
+    mock_parse = feedparser.parse
+
+    def counting_parse(url_or_file, *args, **kwargs):
+        parsed_urls.append(url_or_file)
+        return mock_parse(url_or_file, *args, **kwargs)
+
+    monkeypatch.setattr(feedparser, 'parse', counting_parse)
+    normal, minimal = test_feed_urls['normal_feed'], test_feed_urls['minimal_feed']
+    configs = [
+        FeedConfig(url=normal, output=str(tmp_path / "tech.xml"), include=['tech']),
+        FeedConfig(url=minimal, output=str(tmp_path / "minimal.xml"),
+                   title="Minimal", description="Minimal feed"),
+        FeedConfig(url=normal, output=str(tmp_path / "no_ads.xml"),
+                   exclude=['sponsored']),
+    ]
+
+    process_feeds_batch(configs)
+
+    assert parsed_urls == [normal, minimal]
+    assert [e.title for e in read_rss(tmp_path / "tech.xml").entries] == [TECH]
+    assert len(read_rss(tmp_path / "minimal.xml").entries) == 2
+    assert {e.title for e in read_rss(tmp_path / "no_ads.xml").entries} == {TECH, ELECTION}
+
+
+def test_process_feeds_batch_honors_fast_parse(httpserver, tmp_path):
+    """Test fast_parse configs share one lxml parse and others keep feedparser."""
+    httpserver.expect_request("/feed.xml").respond_with_data(
+        (Path(__file__).parent / "data" / "feeds" / "normal_feed.xml").read_bytes())
+    url = httpserver.url_for("/feed.xml")
+    configs = [
+        FeedConfig(url=url, output=str(tmp_path / "tech.xml"), include=['tech'],
+                   fast_parse=True),
+        FeedConfig(url=url, output=str(tmp_path / "no_ads.xml"),
+                   exclude=['sponsored'], fast_parse=True),
+        FeedConfig(url=url, output=str(tmp_path / "all.xml")),
+    ]
+
+    with patch('podfeedfilter.filterer._fast_parse',
+               wraps=filterer._fast_parse) as fast_parse:
+        process_feeds_batch(configs)
+
+    # One fetch and lxml parse for both fast configs, one for the other
+    assert fast_parse.call_count == 1
+    assert len(httpserver.log) == 2
+    assert [e.title for e in read_rss(tmp_path / "tech.xml").entries] == [TECH]
+    assert {e.title for e in read_rss(tmp_path / "no_ads.xml").entries} == {TECH, ELECTION}
+    assert len(read_rss(tmp_path / "all.xml").entries) == 3
+
+
+def test_process_feeds_batch_fast_parse_falls_back_on_fetch_error(
+        mock_feedparser_parse, test_feed_urls, tmp_path, capsys):
+    """Test a failed fast_parse fetch falls back to feedparser fetching the url."""
+    url = test_feed_urls['normal_feed']
+    config = FeedConfig(url=url, output=str(tmp_path / "tech.xml"),
+                        include=['tech'], fast_parse=True)
+
+    with patch('podfeedfilter.filterer.requests.get',
+               side_effect=requests.ConnectionError("refused")):
+        process_feeds_batch([config])
+
+    assert "Falling back to regular fetch" in capsys.readouterr().out
+    assert [e.title for e in read_rss(tmp_path / "tech.xml").entries] == [TECH]
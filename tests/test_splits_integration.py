@@ -7,14 +7,18 @@ Test requirements:
 3. Assert each contains correct subset per its include/exclude rules
 4. Edge case: one split with only exclude list (no include patterns)
 """
-from pathlib import Path
-import tempfile
-import feedparser
+import re
+
 from podfeedfilter.config import FeedConfig
-from podfeedfilter.filterer import process_feed
+from podfeedfilter.filterer import process_feeds_batch
+from .conftest import read_rss
+
 
+# Matches lowercased titles of advertisement/sponsored episodes
+AD_RE = re.compile(r'advertisement|sponsored')
 
-def test_splits_processing(mock_feedparser_parse):
+
+def test_splits_processing(mock_feedparser_parse, tmp_path):
     """Test processing with multiple splits producing separate outputs."""
     test_splits_config = {
         'splits': [
@@ -44,85 +48,59 @@ def test_splits_processing(mock_feedparser_parse):
         ]
     }
 
-    # Temporary output files
-    output_paths = {}
-    for split in test_splits_config['splits']:
-        with tempfile.NamedTemporaryFile(
-                mode='w', suffix='.xml', delete=False) as f:
-            output_paths[split['name']] = Path(f.name)
-
-    try:
-        # Process each split
-        for split in test_splits_config['splits']:
-            config = FeedConfig(
-                url='http://test/feed1',
-                output=str(output_paths[split['name']]),
-                include=split['filter'].get('include_patterns', []),
-                exclude=split['filter'].get('exclude_patterns', []),
-            )
-
-            process_feed(config)
-
-        # Check files created and contents
-        for split_name, path in output_paths.items():
-            assert path.exists(), f"Output file for {split_name} should exist"
-            feed = feedparser.parse(str(path))
-            print(f"\n{split_name} file has {len(feed.entries)} episodes:")
-            for entry in feed.entries:
-                print(f"  - {entry.title}")
-
-            if split_name == "tech_episodes":
-                # Should include tech episodes, exclude advertisements
-                assert any(
-                    'Tech Trends' in entry.title for entry in feed.entries
-                    ), "Tech episodes file should include tech episodes"
-                assert all(
-                    'advertisement' not in entry.title.lower() and
-                    'sponsored' not in entry.title.lower()
-                    for entry in feed.entries
-                ), "Tech episodes should exclude advertisements"
-            elif split_name == "politics_episodes":
-                # Should include politics episodes, exclude tech
-                assert any(
-                    'Election' in entry.title for entry in feed.entries
-                ), (
-                    "Politics episodes file should include election episodes"
-                )
-                assert all(
-                    'tech' not in entry.title.lower() for entry in feed.entries
-                    ), "Politics episodes should exclude tech"
-            elif split_name == "non_ads":
-                # Should exclude advertisements and sponsored content (edge
-                # case: only exclude list)
-                assert all(
-                    'advertisement' not in entry.title.lower() and
-                    'sponsored' not in entry.title.lower()
-                    for entry in feed.entries
-                ), (
-                    "Non-ads file should exclude advertisements and sponsored "
-                    "content"
-                )
-                # Should include both tech and politics episodes
-                assert len(feed.entries) >= 2, (
-                    "Non-ads should include multiple episodes "
-                    "(tech and politics)"
-                )
+    output_paths = {
+        split['name']: tmp_path / split['output_path']
+        for split in test_splits_config['splits']
+    }
 
-        print("\n✅ SUCCESS: All split processing requirements met!")
-        print("✓ 3 output files created successfully")
-        print("✓ Each file contains correct subset per include/exclude rules")
-        print("✓ Edge case handled: split with only exclude list (non_ads)")
-        print("✓ Tech episodes split: includes tech content, excludes ads")
-        print("✓ Politics episodes split: includes political content, "
-              "excludes tech")
-        print("✓ Non-ads split: excludes advertisements and sponsored content")
+    # Process every split against one parse of the shared source
+    process_feeds_batch([
+        FeedConfig(
+            url='http://test/feed1',
+            output=str(output_paths[split['name']]),
+            include=split['filter'].get('include_patterns', []),
+            exclude=split['filter'].get('exclude_patterns', []),
+        )
+        for split in test_splits_config['splits']
+    ])
 
-    finally:
-        # Cleanup
-        for path in output_paths.values():
-            if path.exists():
-                path.unlink()
+    # Check files created and contents
+    for split_name, path in output_paths.items():
+        assert path.exists(), f"Output file for {split_name} should exist"
+        titles = [entry.title for entry in read_rss(path).entries]
+        lowered = [title.lower() for title in titles]
+        print(f"\n{split_name} file has {len(titles)} episodes:")
+        for title in titles:
+            print(f"  - {title}")
 
+        if split_name == "tech_episodes":
+            # Should include tech episodes, exclude advertisements
+            assert any('Tech Trends' in title for title in titles), (
+                "Tech episodes file should include tech episodes")
+            assert not any(map(AD_RE.search, lowered)), (
+                "Tech episodes should exclude advertisements")
+        elif split_name == "politics_episodes":
+            # Should include politics episodes, exclude tech
+            assert any('Election' in title for title in titles), (
+                "Politics episodes file should include election episodes")
+            assert not any('tech' in title for title in lowered), (
+                "Politics episodes should exclude tech")
+        elif split_name == "non_ads":
+            # Should exclude advertisements and sponsored content (edge
+            # case: only exclude list)
+            assert not any(map(AD_RE.search, lowered)), (
+                "Non-ads file should exclude advertisements and sponsored "
+                "content")
+            # Should include both tech and politics episodes
+            assert len(titles) >= 2, (
+                "Non-ads should include multiple episodes "
+                "(tech and politics)")
 
-if __name__ == "__main__":
-    test_splits_processing()
+    print("\n✅ SUCCESS: All split processing requirements met!")
+    print("✓ 3 output files created successfully")
+    print("✓ Each file contains correct subset per include/exclude rules")
+    print("✓ Edge case handled: split with only exclude list (non_ads)")
+    print("✓ Tech episodes split: includes tech content, excludes ads")
+    print("✓ Politics episodes split: includes political content, "
+          "excludes tech")
+    print("✓ Non-ads split: excludes advertisements and sponsored content")